@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for creating an enumeration class against the number of its
+items.
+
+The namespace is filled item by item like a class body does, then the class
+is created by the metaclass. The built-in `Enum` with the same items is
+measured as the reference.
+
+Usage::
+
+    $ python benchmarks/bench_class_creation.py
+"""
+import time
+from enum import Enum, EnumMeta
+
+from named_enum import LabeledEnum, NamedEnumMeta
+
+MEMBER_NUMBERS = (100, 1000, 10000, 50000)
+REPEAT = 3
+
+
+def create_class(metacls: type, base: type, member_number: int) -> float:
+    """Creates an enumeration class with the given number of items and returns
+    the elapsed seconds."""
+    start = time.perf_counter()
+    namespace = metacls.__prepare__("Country", (base, ))
+    for i in range(member_number):
+        namespace["C%d" % i] = ("c%d" % i, "Country %d" % i)
+    metacls("Country", (base, ), namespace)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print("%-8s %12s %18s %22s"
+          % ("items", "Enum (ms)", "LabeledEnum (ms)", "LabeledEnum (us/item)"))
+    for member_number in MEMBER_NUMBERS:
+        enum_seconds = min(create_class(EnumMeta, Enum, member_number)
+                           for _ in range(REPEAT))
+        named_seconds = min(create_class(NamedEnumMeta, LabeledEnum, member_number)
+                            for _ in range(REPEAT))
+        print("%-8d %12.1f %18.1f %22.2f"
+              % (member_number, enum_seconds * 1e3, named_seconds * 1e3,
+                 named_seconds / member_number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
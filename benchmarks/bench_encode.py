@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for translating a column of field values to the ordinals of the
+enumeration items and back.
+
+`encode`/`decode` are compared with calling `from_key` for each row.
+
+Usage::
+
+    $ python benchmarks/bench_encode.py
+"""
+import time
+
+import numpy as np
+
+from named_enum import LabeledEnum
+
+ROW_NUMBER = 1000000
+MEMBER_NUMBER = 200
+REPEAT = 3
+
+
+def create_enum(member_number: int) -> type:
+    """Creates a LabeledEnum class with the given number of items."""
+    return LabeledEnum.from_records(
+        "Country", (("C%d" % i, ("c%d" % i, "Country %d" % i))
+                    for i in range(member_number)))
+
+
+def measure(func) -> float:
+    """Returns the minimal elapsed seconds of calling the function."""
+    seconds = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def main() -> None:
+    country = create_enum(MEMBER_NUMBER)
+    keys = np.array(country.keys())[np.random.randint(0, MEMBER_NUMBER, ROW_NUMBER)]
+    key_list = keys.tolist()
+    ordinals = country.encode("key", keys)
+    cases = [
+        ("from_key per row", lambda: [country.from_key(key)[0] for key in key_list]),
+        ("encode", lambda: country.encode("key", keys)),
+        ("decode to members", lambda: country.decode(ordinals)),
+        ("decode to labels", lambda: country.decode(ordinals, "label")),
+    ]
+    print("%d rows, %d items" % (ROW_NUMBER, MEMBER_NUMBER))
+    for title, func in cases:
+        seconds = measure(func)
+        print("%-20s %8.1f ms %8.1f ns/row"
+              % (title, seconds * 1e3, seconds / ROW_NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the maps keyed by enumeration items.
+
+`EnumMap` with a list and with an `array.array` is compared with the
+built-in `dict` on the memory of a dense map and the time of the access.
+
+Usage::
+
+    $ python benchmarks/bench_enum_map.py
+"""
+import sys
+import timeit
+
+from named_enum import EnumMap, LabeledEnum
+
+NUMBER = 200000
+MEMBER_NUMBER = 60
+
+
+def main() -> None:
+    category = LabeledEnum.from_records(
+        "Category", (("C%d" % i, ("c%d" % i, "Category %d" % i))
+                     for i in range(MEMBER_NUMBER)))
+    counts = {member: i for i, member in enumerate(category)}
+    cases = [("dict", counts),
+             ("EnumMap", EnumMap(category, counts)),
+             ("EnumMap 'l'", EnumMap(category, counts, typecode='l'))]
+    member = category.C30
+    print("%d items, %d operations per case" % (MEMBER_NUMBER, NUMBER))
+    for title, mapping in cases:
+        if isinstance(mapping, EnumMap):
+            size = sys.getsizeof(mapping) + sys.getsizeof(mapping._values)
+        else:
+            size = sys.getsizeof(mapping)
+        print("%-12s %6d bytes" % (title, size), end="")
+        for operation in ("mapping[member]", "mapping[member] = 1", "list(mapping)"):
+            seconds = min(timeit.repeat(operation, number=NUMBER, repeat=5,
+                                        globals={"mapping": mapping, "member": member}))
+            print(" %20s %7.1f ns" % (operation, seconds / NUMBER * 1e9), end="")
+        print()
+
+
+if __name__ == "__main__":
+    main()
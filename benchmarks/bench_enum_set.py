@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the sets of enumeration items.
+
+`EnumSet` is compared with the built-in `set` on the memory of a set and the
+time of the set algebra.
+
+Usage::
+
+    $ python benchmarks/bench_enum_set.py
+"""
+import random
+import sys
+import timeit
+
+from named_enum import EnumSet, LabeledEnum
+
+NUMBER = 100000
+MEMBER_NUMBER = 60
+
+
+def main() -> None:
+    category = LabeledEnum.from_records(
+        "Category", (("C%d" % i, ("c%d" % i, "Category %d" % i))
+                     for i in range(MEMBER_NUMBER)))
+    random.seed(0)
+    first = random.sample(list(category), MEMBER_NUMBER // 2)
+    second = random.sample(list(category), MEMBER_NUMBER // 2)
+    cases = [("set", set(first), set(second)),
+             ("EnumSet", EnumSet(category, first), EnumSet(category, second))]
+    print("%d items, sets of %d items, %d operations per case"
+          % (MEMBER_NUMBER, MEMBER_NUMBER // 2, NUMBER))
+    for title, left, right in cases:
+        size = sys.getsizeof(left)
+        if isinstance(left, EnumSet):
+            size += sys.getsizeof(left.bits)
+        print("%-8s %6d bytes" % (title, size), end="")
+        for operation in ("left & right", "left | right", "left <= right"):
+            seconds = min(timeit.repeat(operation, number=NUMBER, repeat=5,
+                                        globals={"left": left, "right": right}))
+            print(" %16s %6.1f ns" % (operation, seconds / NUMBER * 1e9), end="")
+        print()
+
+
+if __name__ == "__main__":
+    main()
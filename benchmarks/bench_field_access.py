@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for reading the field values of enumeration items.
+
+It compares the property installed by `NamedEnumMeta` with the previous
+`__getattr__` based lookup, which is reproduced by removing the properties
+from an equivalent enumeration class. The plain lookups of an enumeration
+item and a class attribute show that the functions of the fields don't slow
+down the other attributes of the class.
+
+Usage::
+
+    $ python benchmarks/bench_field_access.py
+"""
+import timeit
+
+from named_enum import NamedEnum
+
+NUMBER = 1000000
+
+
+class LabelEnum(NamedEnum):
+    _field_names_ = ("key", "label")
+
+
+class LegacyLabelEnum(NamedEnum):
+    _field_names_ = ("key", "label")
+
+
+class Color(LabelEnum):
+    RED = ("red", "Red")
+    GREEN = ("green", "Green")
+    BLUE = ("blue", "Blue")
+
+
+class LegacyColor(LegacyLabelEnum):
+    RED = ("red", "Red")
+    GREEN = ("green", "Green")
+    BLUE = ("blue", "Blue")
+
+
+# without the properties the lookup falls back to `NamedEnum.__getattr__`
+for _field_name in LegacyLabelEnum._fields():
+    type.__delattr__(LegacyLabelEnum, _field_name)
+
+
+def main() -> None:
+    cases = [
+        ("member.key (property)", "obj.key", Color.GREEN),
+        ("member.key (__getattr__)", "obj.key", LegacyColor.GREEN),
+        ("member.value.key", "obj.value.key", Color.GREEN),
+        ("Color.RED", "obj.RED", Color),
+        ("Color.__name__", "obj.__name__", Color),
+        ("Color.keys", "obj.keys", Color),
+    ]
+    print("%d lookups per case" % NUMBER)
+    for title, stmt, obj in cases:
+        seconds = min(timeit.repeat(stmt, globals={"obj": obj},
+                                    number=NUMBER, repeat=5))
+        print("%-28s %8.1f ns/lookup" % (title, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    main()
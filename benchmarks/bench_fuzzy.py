@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the fuzzy matching of the values of a field.
+
+`fuzzy_label` with the trigram index of the field is compared with
+`difflib.get_close_matches`, which computes the similarity against every
+label, on an enumeration class with 10k items. The first call includes
+building the index.
+
+Usage::
+
+    $ python benchmarks/bench_fuzzy.py
+"""
+import difflib
+import random
+import time
+import timeit
+
+from named_enum import LabeledEnum
+
+NUMBER = 200
+DIFFLIB_NUMBER = 2
+MEMBER_NUMBER = 10000
+WORDS = ("north", "south", "east", "west", "river", "lake", "mount", "valley",
+         "port", "bay", "green", "old", "new", "saint", "upper", "lower")
+
+
+def create_labels(member_number: int) -> list:
+    """Returns the given number of distinct labels of random place names."""
+    rng = random.Random(0)
+    labels = []
+    for i in range(member_number):
+        labels.append("%s %s %d" % (rng.choice(WORDS).title(),
+                                    rng.choice(WORDS).title(), i))
+    return labels
+
+
+def main() -> None:
+    labels = create_labels(MEMBER_NUMBER)
+    place = LabeledEnum.from_records(
+        "Place", (("P%d" % i, ("p%d" % i, label)) for i, label in enumerate(labels)))
+    text = "nort vally 5000"
+    start = time.perf_counter()
+    place.fuzzy_label(text)
+    print("%d items, index built by the first call in %.1f ms"
+          % (MEMBER_NUMBER, (time.perf_counter() - start) * 1e3))
+    cases = [("fuzzy_label", lambda: place.fuzzy_label(text), NUMBER),
+             ("difflib", lambda: difflib.get_close_matches(text, labels, n=5, cutoff=0.3),
+              DIFFLIB_NUMBER)]
+    for title, func, number in cases:
+        seconds = min(timeit.repeat(func, number=number, repeat=3))
+        print("%-12s %10.1f us/call" % (title, seconds / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for importing a module defining a few hundred enumeration
+classes.
+
+The functions of the fields, like `keys`, `from_key`, `has_key`, are created
+lazily, so the import only pays for the class creation. The second case
+accesses all the functions after the import, which is the cost of creating
+them eagerly.
+
+Usage::
+
+    $ python benchmarks/bench_import.py
+"""
+import importlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ENUM_NUMBER = 300
+MEMBER_NUMBER = 8
+REPEAT = 5
+MODULE_NAME = "bench_import_enums"
+
+
+def module_source() -> str:
+    """Returns the source of a module with `ENUM_NUMBER` LabeledEnum classes,
+    each one has `MEMBER_NUMBER` items."""
+    lines = ["from named_enum import LabeledEnum", ""]
+    for i in range(ENUM_NUMBER):
+        lines.append("")
+        lines.append("class Enum%d(LabeledEnum):" % i)
+        for j in range(MEMBER_NUMBER):
+            lines.append("    ITEM_%d = ('key_%d_%d', 'Label %d %d')"
+                         % (j, i, j, i, j))
+    return "\n".join(lines) + "\n"
+
+
+def import_module(touch_functions: bool) -> float:
+    """Imports the generated module freshly and returns the elapsed seconds."""
+    sys.modules.pop(MODULE_NAME, None)
+    start = time.perf_counter()
+    module = importlib.import_module(MODULE_NAME)
+    if touch_functions:
+        for i in range(ENUM_NUMBER):
+            enum_cls = getattr(module, "Enum%d" % i)
+            for field_name in enum_cls._fields():
+                getattr(enum_cls, "%ss" % field_name)
+                getattr(enum_cls, "from_%s" % field_name)
+                getattr(enum_cls, "has_%s" % field_name)
+    return time.perf_counter() - start
+
+
+def measure_memory(touch_functions: bool) -> int:
+    """Returns the memory in bytes allocated by importing the module."""
+    sys.modules.pop(MODULE_NAME, None)
+    tracemalloc.start()
+    import_module(touch_functions)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        with open(os.path.join(folder, MODULE_NAME + ".py"), "w") as f:
+            f.write(module_source())
+        sys.path.insert(0, folder)
+        # warm up and compile the module once
+        import_module(False)
+        print("%d enumeration classes with %d items each"
+              % (ENUM_NUMBER, MEMBER_NUMBER))
+        for title, touch_functions in [("import", False),
+                                       ("import + all field functions", True)]:
+            seconds = min(import_module(touch_functions) for _ in range(REPEAT))
+            memory = measure_memory(touch_functions)
+            print("%-30s %8.1f ms %8.1f KiB"
+                  % (title, seconds * 1e3, memory / 1024))
+        sys.path.remove(folder)
+        sys.modules.pop(MODULE_NAME, None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the functions of the fields, like `keys`, `from_key` and
+`has_key`.
+
+The generated functions are compared with calling the base functions of
+`NamedEnumMeta` through `functools.partial`, which is how the functions were
+generated before.
+
+Usage::
+
+    $ python benchmarks/bench_lookup.py
+"""
+import timeit
+from functools import partial
+
+from named_enum import LabeledEnum, NamedEnumMeta
+
+NUMBER = 200000
+MEMBER_NUMBER = 500
+
+
+def create_enum(member_number: int) -> NamedEnumMeta:
+    """Creates a LabeledEnum class with the given number of items."""
+    namespace = NamedEnumMeta.__prepare__("Country", (LabeledEnum, ))
+    for i in range(member_number):
+        namespace["C%d" % i] = ("c%d" % i, "Country %d" % i)
+    return NamedEnumMeta("Country", (LabeledEnum, ), namespace)
+
+
+def main() -> None:
+    country = create_enum(MEMBER_NUMBER)
+    partial_funcs = {
+        "keys": partial(NamedEnumMeta._field_values, country, "key"),
+        "from_key": partial(NamedEnumMeta._from_field, country, "key"),
+        "has_key": partial(NamedEnumMeta._has_field, country, "key"),
+    }
+    key = "c%d" % (MEMBER_NUMBER // 2)
+    cases = [("keys", "func()"),
+             ("from_key", "func(key)"),
+             ("has_key", "func(key)")]
+    print("%d items, %d calls per case" % (MEMBER_NUMBER, NUMBER))
+    for func_name, stmt in cases:
+        for title, func in [("generated", getattr(country, func_name)),
+                            ("partial", partial_funcs[func_name])]:
+            seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=5,
+                                        globals={"func": func, "key": key}))
+            print("%-10s %-10s %8.1f ns/call"
+                  % (func_name, title, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for creating enumeration classes dynamically with `namedenum`.
+
+The class is created by `NamedEnumMeta` directly. The previous implementation,
+which formats the class template and executes it, is reproduced as the
+reference.
+
+Usage::
+
+    $ python benchmarks/bench_namedenum.py
+"""
+import time
+
+from named_enum import namedenum
+from named_enum.enum import _class_template
+
+CLASS_NUMBER = 500
+REPEAT = 5
+FIELD_NAMES = ("key", "label", "description")
+
+
+def namedenum_exec(typename: str, field_names: tuple) -> type:
+    """Creates the named enum class by executing the class template."""
+    class_definition = _class_template.format(typename=typename,
+                                              field_names=field_names)
+    namespace = dict(__name__=typename)
+    exec(class_definition, namespace)  # nosec
+    result = namespace[typename]
+    result._source = class_definition
+    result.__module__ = __name__
+    return result
+
+
+def create_classes(factory) -> float:
+    """Creates `CLASS_NUMBER` classes with the given factory and returns the
+    elapsed seconds."""
+    start = time.perf_counter()
+    for i in range(CLASS_NUMBER):
+        factory("Tenant%dEnum" % i, FIELD_NAMES)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print("%d classes per case" % CLASS_NUMBER)
+    for title, factory in [("exec template", namedenum_exec),
+                           ("NamedEnumMeta", namedenum)]:
+        seconds = min(create_classes(factory) for _ in range(REPEAT))
+        print("%-15s %8.1f ms %10.0f classes/s"
+              % (title, seconds * 1e3, CLASS_NUMBER / seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,3 @@
 from .meta import NamedEnumMeta
 from .enum import NamedEnum, ExtendedEnum, LabeledEnum, PairEnum, namedenum
+from .containers import EnumSet, EnumMap
@@ -0,0 +1,518 @@
+# -*- coding: utf-8 -*-
+"""Module for the containers of enumeration items. It contains two classes:
+`EnumSet` and `EnumMap`.
+"""
+from array import array
+from collections.abc import MutableMapping, MutableSet
+from enum import Enum
+from itertools import compress
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Union, cast
+
+from .meta import NamedEnumMeta
+
+__all__ = ['EnumSet', 'EnumMap']
+
+# from python 3.10, the number of the set bits is counted by `int.bit_count`
+_bit_count = getattr(int, 'bit_count', lambda bits: bin(bits).count('1'))
+
+_bit_selectors = bytes.maketrans(b'01', b'\x00\x01')
+"""Translation table from the binary digits to the bytes 0 and 1."""
+
+
+def _iter_bits(members: Sequence, bits: int) -> Iterator:
+    """Returns an iterator over the items, whose bits are set in the given bit
+    mask, the n-th bit corresponds to the n-th item.
+
+    Args:
+        members (Sequence): items indexed by their bits.
+        bits (int): bit mask of the items to iterate.
+
+    Returns:
+        Iterator: the items in the given order.
+    """
+    # the binary digits from the lowest bit on, translated to the bytes 0 and
+    # 1, select the items
+    return compress(members, bin(bits)[:1:-1].encode().translate(_bit_selectors))
+
+
+class EnumSet(MutableSet):
+    """Set of the enumeration items of a named enum class, which stores the
+    membership as the bits of an integer, the n-th bit is set if the
+    enumeration item with ordinal n is included. The set algebra between two
+    sets of the same enumeration class is computed by the bitwise operations
+    on the integers, and the iteration follows the definition order.
+
+    Args:
+        enum_cls (NamedEnumMeta): the named enum class.
+        members (Optional[Iterable]): enumeration items to include, e.g. the
+         result of the function `from_<field_name>`.
+
+    Raises:
+        TypeError: if enum_cls is not a named enum class, or any of the given
+         items isn't an enumeration item of it.
+
+    Examples:
+        >>> from named_enum import LabeledEnum
+        >>> class Color(LabeledEnum):
+        ...     RED = ("red", "Red")
+        ...     GREEN = ("green", "Green")
+        ...     BLUE = ("blue", "Blue")
+        >>> warm = EnumSet(Color, [Color.RED])
+        >>> warm | EnumSet(Color, Color.from_key("blue"))
+        EnumSet(Color, [Color.RED, Color.BLUE])
+        >>> Color.GREEN in warm
+        False
+        >>> warm.bits
+        1
+    """
+    __slots__ = ('_enum_cls', '_bits')
+
+    def __init__(self, enum_cls: NamedEnumMeta, members: Optional[Iterable] = None) -> None:
+        if not isinstance(enum_cls, NamedEnumMeta):
+            raise TypeError("%r is not a named enum class." % (enum_cls, ))
+        self._enum_cls = enum_cls
+        self._bits = 0 if members is None else self._bits_of(members)
+
+    @classmethod
+    def from_bits(cls, enum_cls: NamedEnumMeta, bits: int) -> 'EnumSet':
+        """Creates the set from the integer returned by the property `bits`.
+
+        Args:
+            enum_cls (NamedEnumMeta): the named enum class.
+            bits (int): the n-th bit is set if the enumeration item with
+             ordinal n is included.
+
+        Returns:
+            EnumSet: the set of the enumeration items.
+
+        Raises:
+            ValueError: if a bit doesn't correspond to any enumeration item.
+        """
+        result = cls(enum_cls)
+        if not 0 <= bits < 1 << len(enum_cls._ordinal_members()):
+            raise ValueError("%r is not a valid bit mask of %s." % (bits, enum_cls.__name__))
+        result._bits = bits
+        return result
+
+    @property
+    def enum_cls(self) -> NamedEnumMeta:
+        """NamedEnumMeta: the named enum class of the set."""
+        return self._enum_cls
+
+    @property
+    def bits(self) -> int:
+        """int: the bit mask of the set, the n-th bit is set if the
+        enumeration item with ordinal n is included."""
+        return self._bits
+
+    def _bit_of(self, member: Any) -> int:
+        """Returns the bit of the given enumeration item.
+
+        Args:
+            member (Any): enumeration item.
+
+        Returns:
+            int: the bit of the enumeration item.
+
+        Raises:
+            TypeError: if the given item isn't an enumeration item of the
+             class of the set.
+        """
+        if not isinstance(member, self._enum_cls):
+            raise TypeError("%r is not an enumeration item of %s."
+                            % (member, self._enum_cls.__name__))
+        return 1 << member._ordinal_
+
+    def _bits_of(self, members: Iterable, strict: bool = True) -> int:
+        """Returns the bit mask of the given enumeration items.
+
+        Args:
+            members (Iterable): enumeration items of the class of the set.
+            strict (bool): raises an error for the items of other classes if
+             True; otherwise ignores them. Default value is True.
+
+        Returns:
+            int: the bit mask of the enumeration items.
+        """
+        if isinstance(members, EnumSet) and members._enum_cls is self._enum_cls:
+            return members._bits
+        bits = 0
+        for member in members:
+            if strict or isinstance(member, self._enum_cls):
+                bits |= self._bit_of(member)
+        return bits
+
+    def _from_bits(self, bits: int) -> 'EnumSet':
+        """Creates a set of the same enumeration class with the given bit
+        mask."""
+        result = object.__new__(type(self))
+        result._enum_cls = self._enum_cls
+        result._bits = bits
+        return result
+
+    def _from_iterable(self, members: Iterable) -> 'EnumSet':
+        """Creates a set of the same enumeration class, it's used by the
+        mixin methods of `Set`."""
+        return self._from_bits(self._bits_of(members))
+
+    def __contains__(self, member: Any) -> bool:
+        return isinstance(member, self._enum_cls) and bool(self._bits >> member._ordinal_ & 1)
+
+    def __iter__(self) -> Iterator:
+        return _iter_bits(self._enum_cls._ordinal_members(), self._bits)
+
+    def __len__(self) -> int:
+        return _bit_count(self._bits)
+
+    def __bool__(self) -> bool:
+        return bool(self._bits)
+
+    def __repr__(self) -> str:
+        return "%s(%s, [%s])" % (
+            self.__class__.__name__, self._enum_cls.__name__,
+            ", ".join("%s.%s" % (self._enum_cls.__name__, member._name_) for member in self))
+
+    def __reduce__(self) -> tuple:
+        """Pickles the set as the enumeration class and the bit mask."""
+        return self.__class__.from_bits, (self._enum_cls, self._bits)
+
+    def _same_cls_bits(self, other: Any) -> Optional[int]:
+        """Returns the bit mask of the other operand, if it's a set of the
+        same enumeration class; otherwise None, then the operation falls back
+        to the generic implementation of `Set`."""
+        if isinstance(other, EnumSet) and other._enum_cls is self._enum_cls:
+            return other._bits
+        return None
+
+    def __eq__(self, other: Any) -> bool:
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return super().__eq__(other)
+        return self._bits == bits
+
+    __hash__ = None  # type: ignore
+
+    def __le__(self, other: Any) -> bool:
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return super().__le__(other)
+        return self._bits & ~bits == 0
+
+    def __lt__(self, other: Any) -> bool:
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return super().__lt__(other)
+        return self._bits != bits and self._bits & ~bits == 0
+
+    def __ge__(self, other: Any) -> bool:
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return super().__ge__(other)
+        return bits & ~self._bits == 0
+
+    def __gt__(self, other: Any) -> bool:
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return super().__gt__(other)
+        return self._bits != bits and bits & ~self._bits == 0
+
+    def __and__(self, other: Any) -> 'EnumSet':
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return cast('EnumSet', super().__and__(other))
+        return self._from_bits(self._bits & bits)
+
+    def __or__(self, other: Any) -> 'EnumSet':
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return cast('EnumSet', super().__or__(other))
+        return self._from_bits(self._bits | bits)
+
+    def __sub__(self, other: Any) -> 'EnumSet':
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return cast('EnumSet', super().__sub__(other))
+        return self._from_bits(self._bits & ~bits)
+
+    def __xor__(self, other: Any) -> 'EnumSet':
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return cast('EnumSet', super().__xor__(other))
+        return self._from_bits(self._bits ^ bits)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __iand__(self, other: Any) -> 'EnumSet':
+        self._bits &= self._bits_of(other, strict=False)
+        return self
+
+    def __ior__(self, other: Any) -> 'EnumSet':
+        self._bits |= self._bits_of(other)
+        return self
+
+    def __isub__(self, other: Any) -> 'EnumSet':
+        self._bits &= ~self._bits_of(other, strict=False)
+        return self
+
+    def __ixor__(self, other: Any) -> 'EnumSet':
+        self._bits ^= self._bits_of(other)
+        return self
+
+    def isdisjoint(self, other: Iterable) -> bool:
+        """Returns True if the set has no items in common with the other."""
+        return not self._bits & self._bits_of(other, strict=False)
+
+    def add(self, member: Enum) -> None:
+        self._bits |= self._bit_of(member)
+
+    def discard(self, member: Any) -> None:
+        if member in self:
+            self._bits ^= 1 << member._ordinal_
+
+    def remove(self, member: Any) -> None:
+        if member not in self:
+            raise KeyError(member)
+        self._bits ^= 1 << member._ordinal_
+
+    def update(self, *others: Iterable) -> None:
+        """Adds the items of the others to the set."""
+        for other in others:
+            self._bits |= self._bits_of(other)
+
+    def clear(self) -> None:
+        self._bits = 0
+
+    def copy(self) -> 'EnumSet':
+        """Returns a shallow copy of the set."""
+        return self._from_bits(self._bits)
+
+    def union(self, *others: Iterable) -> 'EnumSet':
+        """Returns the union of the set and the others."""
+        bits = self._bits
+        for other in others:
+            bits |= self._bits_of(other)
+        return self._from_bits(bits)
+
+    def intersection(self, *others: Iterable) -> 'EnumSet':
+        """Returns the intersection of the set and the others."""
+        bits = self._bits
+        for other in others:
+            bits &= self._bits_of(other, strict=False)
+        return self._from_bits(bits)
+
+    def difference(self, *others: Iterable) -> 'EnumSet':
+        """Returns the items of the set, which are not in the others."""
+        bits = self._bits
+        for other in others:
+            bits &= ~self._bits_of(other, strict=False)
+        return self._from_bits(bits)
+
+    def symmetric_difference(self, other: Iterable) -> 'EnumSet':
+        """Returns the items in either the set or the other but not both."""
+        return self._from_bits(self._bits ^ self._bits_of(other))
+
+    def issubset(self, other: Iterable) -> bool:
+        """Returns True if every item of the set is in the other."""
+        return self._bits & ~self._bits_of(other, strict=False) == 0
+
+    def issuperset(self, other: Iterable) -> bool:
+        """Returns True if every item of the other is in the set."""
+        bits = self._same_cls_bits(other)
+        if bits is None:
+            return all(member in self for member in other)
+        return bits & ~self._bits == 0
+
+
+_missing = object()
+"""Marker of the enumeration items without values in `EnumMap`."""
+
+
+class EnumMap(MutableMapping):
+    """Mapping from the enumeration items of a named enum class to the
+    values, which stores the values in a fixed-size list indexed by the
+    ordinals of the items, such that no item is hashed on the access. The
+    keys are tracked as the bits of an integer like `EnumSet`, and the
+    iteration follows the definition order.
+
+    Args:
+        enum_cls (NamedEnumMeta): the named enum class.
+        data (Optional[Union[Mapping, Iterable]]): initial items, a mapping or
+         an iterable of key-value-pairs.
+        typecode (Optional[str]): stores the values in an `array.array` with
+         the given type code instead of a list, e.g. 'l' for integers and 'd'
+         for floats. Default value is None, which means using a list.
+
+    Raises:
+        TypeError: if enum_cls is not a named enum class, or any of the given
+         keys isn't an enumeration item of it.
+
+    Examples:
+        >>> from named_enum import LabeledEnum
+        >>> class Color(LabeledEnum):
+        ...     RED = ("red", "Red")
+        ...     GREEN = ("green", "Green")
+        ...     BLUE = ("blue", "Blue")
+        >>> counter = EnumMap(Color, typecode='l')
+        >>> counter[Color.BLUE] = 2
+        >>> counter[Color.RED] = 1
+        >>> counter
+        EnumMap(Color, {Color.RED: 1, Color.BLUE: 2}, typecode='l')
+        >>> counter[Color.GREEN]
+        Traceback (most recent call last):
+        ...
+        KeyError: <Color.GREEN: NamedTuple(key='green', label='Green')>
+    """
+    __slots__ = ('_enum_cls', '_typecode', '_bits', '_values')
+
+    def __init__(self, enum_cls: NamedEnumMeta,
+                 data: Optional[Union[Mapping, Iterable]] = None, *,
+                 typecode: Optional[str] = None) -> None:
+        if not isinstance(enum_cls, NamedEnumMeta):
+            raise TypeError("%r is not a named enum class." % (enum_cls, ))
+        self._enum_cls = enum_cls
+        self._typecode = typecode
+        self._bits = 0
+        self._values = self._empty_values()
+        if data is not None:
+            self.update(data)
+
+    def _empty_values(self) -> Union[List, array]:
+        """Returns the storage of the values without any value."""
+        size = len(self._enum_cls._ordinal_members())
+        if self._typecode is None:
+            return [_missing] * size
+        return array(self._typecode, bytes(array(self._typecode).itemsize * size))
+
+    @classmethod
+    def _from_state(cls, enum_cls: NamedEnumMeta, typecode: Optional[str], bits: int,
+                    values: Union[List, array]) -> 'EnumMap':
+        """Restores the map from the state returned by `__reduce__`."""
+        keys = EnumSet.from_bits(enum_cls, bits)
+        result = cls(enum_cls, typecode=typecode)
+        if typecode is not None and \
+                (not isinstance(values, array) or values.typecode != typecode):
+            raise ValueError("The values don't match the type code %r." % typecode)
+        if len(values) != (len(keys) if typecode is None else len(result._values)):
+            raise ValueError("The values don't match the items of %s." % enum_cls.__name__)
+        if typecode is None:
+            result.update(zip(keys, values))
+        else:
+            result._bits = bits
+            # copied, such that the map never shares the storage
+            result._values = array(typecode, values)
+        return result
+
+    @property
+    def enum_cls(self) -> NamedEnumMeta:
+        """NamedEnumMeta: the named enum class of the map."""
+        return self._enum_cls
+
+    @property
+    def typecode(self) -> Optional[str]:
+        """Optional[str]: type code of the `array.array` storing the values,
+        or None if they are stored in a list."""
+        return self._typecode
+
+    def _ordinal_of(self, member: Any) -> int:
+        """Returns the ordinal of the given key, or raises a KeyError if it
+        isn't an enumeration item of the class of the map."""
+        if not isinstance(member, self._enum_cls):
+            raise KeyError(member)
+        return member._ordinal_
+
+    def __getitem__(self, member: Any) -> Any:
+        ordinal = self._ordinal_of(member)
+        if not self._bits >> ordinal & 1:
+            raise KeyError(member)
+        return self._values[ordinal]
+
+    def get(self, member: Any, default: Any = None) -> Any:
+        if not isinstance(member, self._enum_cls) or \
+                not self._bits >> member._ordinal_ & 1:
+            return default
+        return self._values[member._ordinal_]
+
+    def __setitem__(self, member: Any, value: Any) -> None:
+        if not isinstance(member, self._enum_cls):
+            raise TypeError("%r is not an enumeration item of %s."
+                            % (member, self._enum_cls.__name__))
+        ordinal = member._ordinal_
+        self._values[ordinal] = value
+        self._bits |= 1 << ordinal
+
+    def __delitem__(self, member: Any) -> None:
+        ordinal = self._ordinal_of(member)
+        if not self._bits >> ordinal & 1:
+            raise KeyError(member)
+        self._bits ^= 1 << ordinal
+        if self._typecode is None:
+            self._values[ordinal] = _missing
+        else:
+            # resets the slot to the zero value of the type code, e.g. 0 or
+            # '\x00', like the ones of an empty map
+            self._values[ordinal:ordinal + 1] = array(self._typecode,
+                                                      bytes(array(self._typecode).itemsize))
+
+    def __contains__(self, member: Any) -> bool:
+        return isinstance(member, self._enum_cls) and bool(self._bits >> member._ordinal_ & 1)
+
+    def __iter__(self) -> Iterator:
+        return _iter_bits(self._enum_cls._ordinal_members(), self._bits)
+
+    def __len__(self) -> int:
+        return _bit_count(self._bits)
+
+    def key_set(self) -> EnumSet:
+        """Returns the keys as an `EnumSet`.
+
+        Returns:
+            EnumSet: the enumeration items having values in the map.
+        """
+        return EnumSet.from_bits(self._enum_cls, self._bits)
+
+    def clear(self) -> None:
+        self._bits = 0
+        self._values = self._empty_values()
+
+    def copy(self) -> 'EnumMap':
+        """Returns a shallow copy of the map."""
+        result = object.__new__(type(self))
+        result._enum_cls = self._enum_cls
+        result._typecode = self._typecode
+        result._bits = self._bits
+        result._values = self._values[:]
+        return result
+
+    __copy__ = copy
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, EnumMap) and other._enum_cls is self._enum_cls:
+            return self._bits == other._bits and \
+                all(self._values[member._ordinal_] == other._values[member._ordinal_]
+                    for member in self)
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        name = self._enum_cls.__name__
+        items = ", ".join("%s.%s: %r" % (name, member._name_, value)
+                          for member, value in self.items())
+        if self._typecode is None:
+            return "%s(%s, {%s})" % (self.__class__.__name__, name, items)
+        return "%s(%s, {%s}, typecode=%r)" % (self.__class__.__name__, name, items,
+                                              self._typecode)
+
+    def __reduce__(self) -> tuple:
+        """Pickles the map as the enumeration class, the type code, the bit
+        mask of the keys and the values. A list only contains the values of
+        the keys, an array is kept as it is."""
+        if self._typecode is None:
+            values: Union[List, array] = [value for value in self._values
+                                          if value is not _missing]
+        else:
+            values = self._values
+        return self.__class__._from_state, (self._enum_cls, self._typecode,
+                                            self._bits, values)
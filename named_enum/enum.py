@@ -5,11 +5,13 @@ classes:
 `namedenum`.
 """
 import sys as _sys
+from collections import namedtuple, OrderedDict
 from enum import Enum
 from typing import (
-    Any, Optional, Sequence, Tuple, Union
+    Any, Callable, Hashable, Mapping, NamedTuple, Optional, Sequence, Tuple,
+    Union
 )
-from .meta import NamedEnumMeta
+from .meta import NamedEnumMeta, _normalize_field_names
 
 __all__ = [
     'NamedEnum', 'ExtendedEnum', 'LabeledEnum', 'PairEnum', 'namedenum'
@@ -23,7 +25,7 @@ class NamedEnum(Enum, metaclass=NamedEnumMeta):
     1.  value of `_field_names_` is `None` or empty. In this case, its
     subclass works like an extended Enum class with extra function:
     `names`, `values`, `as_dict`, `as_list`, `as_set`, `as_tuple`,
-    `as_ordereddict`, `describe`.
+    `as_ordereddict`, `as_mapping`, `as_frozenset`, `describe`.
 
     2.  value of `_field_names_` is neither `None` or empty. In this case, its
     subclass keeps the extra functions mentioned in **1**, and gives each
@@ -31,8 +33,13 @@ class NamedEnum(Enum, metaclass=NamedEnumMeta):
     each attribute/field, like: `<field_name>s`, `from_<field_name>`,
     `has_<field_name>`.
 
-    Instead of the setting the attributes to the enumeration instance, it uses
-    the function `__getattr__` to achieve it.
+    Instead of the setting the attributes to the enumeration instance, the
+    metaclass installs a property for each field on the class, which reads the
+    value from the named tuple. The function `__getattr__` is kept as the
+    fallback. It also installs the property `ordinal`, which returns the
+    position of the enumeration item in the definition order, starting from 0,
+    unless a field is named `ordinal`. The aliases have the ordinals of their
+    canonical items.
 
     Examples:
         >>> class TripleEnum(NamedEnum):
@@ -106,6 +113,10 @@ class NamedEnum(Enum, metaclass=NamedEnumMeta):
         'RIGHT'
         >>> Triangle.RIGHT.value
         NamedTuple(first=3, second=4, third=5)
+        >>> Triangle.RIGHT.ordinal
+        1
+        >>> Triangle.from_ordinal(1)
+        <Triangle.RIGHT: NamedTuple(first=3, second=4, third=5)>
         >>> print(Triangle.RIGHT)
         Triangle.RIGHT: NamedTuple(first=3, second=4, third=5)
     """
@@ -123,6 +134,23 @@ class NamedEnum(Enum, metaclass=NamedEnumMeta):
     **Attention**: this variable should not be used to get the field_names, to
     do so you can use the class method `_fields`. Because it also accept the
     comma separated string."""
+    _indexes_: Union[Sequence, None] = None
+
+    """The place to declare the composite indexes of the enumeration class for
+    the function `from_fields`. Each index is defined by its field names in
+    the same format as `_field_names_`, e.g. `[("first", "second")]`."""
+    _normalizers_: Union[Mapping[str, Callable], None] = None
+
+    """The place to declare the normalizers of the fields for the functions
+    `from_<field_name>_normalized`, e.g. `{"key": str.casefold}`. The values
+    of the fields are normalized once at the class creation."""
+    _unique_fields_: Union[str, Sequence, None] = None
+
+    """The place to declare the fields, whose values are unique among the
+    enumeration items, for the functions `get_by_<field_name>`, in the same
+    format as `_field_names_`. The duplicate values are rejected at the class
+    creation."""
+
     def __getattr__(self, item: str) -> Any:
         """Hijacks the default `__getattr__` function, such that every time when the
         user wants to get the value of a field in an enumeration item, it
@@ -425,8 +453,97 @@ class {typename}(NamedEnum):
 """
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+"""Statistics of the cache of the classes created by `namedenum`."""
+
+
+class _ClassCache:
+    """Least recently used cache of the classes created by `namedenum`, it
+    holds at most `maxsize` classes.
+
+    Args:
+        maxsize (int): maximal number of the cached classes.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._classes: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def _evict(self) -> None:
+        """Evicts the least recently used classes exceeding the maximal
+        size."""
+        while len(self._classes) > self.maxsize:
+            self._classes.popitem(last=False)
+
+    def get(self, key: Hashable) -> Optional[NamedEnumMeta]:
+        """Returns the cached class of the given key and marks it as the most
+        recently used one, or None if it's not cached.
+
+        Args:
+            key (Hashable): key of the class.
+
+        Returns:
+            Optional[NamedEnumMeta]: the cached class or None.
+        """
+        try:
+            result = self._classes[key]
+        except KeyError:
+            self._misses += 1
+            return None
+        self._classes.move_to_end(key)
+        self._hits += 1
+        return result
+
+    def put(self, key: Hashable, value: NamedEnumMeta) -> None:
+        """Caches the class with the given key and evicts the least recently
+        used classes exceeding the maximal size.
+
+        Args:
+            key (Hashable): key of the class.
+            value (NamedEnumMeta): the class to cache.
+        """
+        self._classes[key] = value
+        self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the maximal number of the cached classes, evicts the least
+        recently used classes exceeding it.
+
+        Args:
+            maxsize (int): maximal number of the cached classes.
+
+        Raises:
+            ValueError: if maxsize isn't a non-negative integer.
+        """
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 0:
+            raise ValueError("%r is not a valid size of the cache." % (maxsize, ))
+        self.maxsize = maxsize
+        self._evict()
+
+    def info(self) -> NamedTuple:
+        """Returns the statistics of the cache.
+
+        Returns:
+            NamedTuple: hits, misses, maxsize and currsize of the cache.
+        """
+        return CacheInfo(self._hits, self._misses, self.maxsize,
+                         len(self._classes))
+
+    def clear(self) -> None:
+        """Clears the cached classes and the statistics."""
+        self._classes.clear()
+        self._hits = self._misses = 0
+
+
+_namedenum_cache = _ClassCache(maxsize=128)
+"""Cache of the classes created by `namedenum` with `cache=True`."""
+
+
 def namedenum(typename: str, field_names: Optional[Sequence] = None, *,
-              verbose: Optional[bool] = False, module: Optional[str] = None) -> object:
+              verbose: Optional[bool] = False, module: Optional[str] = None,
+              cache: bool = False) -> object:
     """Creates an named enum class with the given typename as class name and
     field_names as the _field_names_ in named enum class. The implementation is
     similar to the namedtuple function.
@@ -434,9 +551,15 @@ def namedenum(typename: str, field_names: Optional[Sequence] = None, *,
     Args:
         typename (str): name for the created class.
         field_names (Optional[Sequence]): field names for the named enum class.
-        verbose (Optional[bool]): displays the code for the named enum class
-         creation, if True.
+        verbose (Optional[bool]): displays the equivalent source code of the
+         named enum class, if True.
         module (Optional[str]): which module the new created enum class belongs to.
+        cache (bool): reuses the class created before with the same typename,
+         field names and module, if True. At most 128 classes are cached by
+         default, the least recently used ones are evicted first. The size is
+         changed by `namedenum.cache_resize(maxsize)`, the statistics are
+         returned by `namedenum.cache_info()` and the cache is cleared by
+         `namedenum.cache_clear()`.
 
     Returns:
         object: subclass of NamedEnum
@@ -445,22 +568,10 @@ def namedenum(typename: str, field_names: Optional[Sequence] = None, *,
         >>> TripleEnum = namedenum("TripleEnum", ("first", "second", "third"))
         >>> TripleEnum
         <named enum 'TripleEnum'>
+        >>> namedenum("PairEnum", "first, second", cache=True) is \\
+        ...     namedenum("PairEnum", ("first", "second"), cache=True)
+        True
     """
-    # Fill-in the class template
-    class_definition = _class_template.format(
-        typename=typename,
-        field_names=field_names
-    )
-
-    # Execute the template string in a temporary namespace and support
-    # tracing utilities by setting a value for frame.f_globals['__name__']
-    namespace = dict(__name__='%s' % typename)
-    exec(class_definition, namespace)  # nosec
-    result = namespace[typename]
-    result._source = class_definition  # type: ignore
-    if verbose:
-        print(result._source)  # type: ignore
-
     # For pickling to work, the __module__ variable needs to be set to the frame
     # where the named tuple is created.  Bypass this step in environments where
     # sys._getframe is not defined (Jython for example) or sys._getframe is not
@@ -471,7 +582,36 @@ def namedenum(typename: str, field_names: Optional[Sequence] = None, *,
             module = _sys._getframe(1).f_globals.get('__name__', '__main__')
         except (AttributeError, ValueError):
             pass
-    if module is not None:
-        result.__module__ = module
+
+    if cache:
+        key = (typename,
+               None if field_names is None else _normalize_field_names(field_names),
+               module)
+        result = _namedenum_cache.get(key)
+    else:
+        result = None
+
+    if result is None:
+        # Create the class through the metaclass directly, it's equivalent to
+        # executing the class template but skips compiling the source
+        namespace = NamedEnumMeta.__prepare__(typename, (NamedEnum, ))
+        namespace['__module__'] = typename
+        namespace['__qualname__'] = typename
+        namespace['_field_names_'] = field_names
+        result = NamedEnumMeta(typename, (NamedEnum, ), namespace)
+        if module is not None:
+            result.__module__ = module
+        if cache:
+            _namedenum_cache.put(key, result)
+
+    if verbose:
+        # render the equivalent source only on demand
+        print(_class_template.format(typename=typename,
+                                     field_names=field_names))
 
     return result
+
+
+namedenum.cache_info = _namedenum_cache.info  # type: ignore
+namedenum.cache_clear = _namedenum_cache.clear  # type: ignore
+namedenum.cache_resize = _namedenum_cache.resize  # type: ignore
@@ -3,78 +3,831 @@
 `NamedEnumMeta`, `_NamedEnumDict`."""
 # mypy: ignore-errors
 import sys as _sys
-from collections import namedtuple, OrderedDict
+from array import array as _array
+from bisect import bisect_left, bisect_right
+from collections import Counter, namedtuple, OrderedDict
 from collections.abc import Sequence
-from enum import Enum, EnumMeta, _EnumDict
+from enum import Enum, EnumMeta, _EnumDict, _is_dunder, _is_sunder
 from functools import partial
+from heapq import nlargest
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
 from typing import (
-    Any, ClassVar, Dict, Generator, List, NamedTuple, Optional, Set, Tuple, Union, Type
+    Any, Callable, ClassVar, Dict, FrozenSet, Generator, Iterable, Iterator, List, Mapping, NamedTuple,
+    Optional, Set, Tuple, Union, Type
 )
 
 __all__ = ['NamedEnumMeta']
 
 
 class _NamedEnumDict(_EnumDict):
-    """Customizes _EnumDict, such that it allows setting the value for the keyword
-    '_field_names_' and provides the functions for cleaning itself and
-    converting the collection type value (except str) to NamedTuple type.
+    """Customizes _EnumDict, such that it allows setting the value for the keywords
+    '_field_names_', '_indexes_', '_normalizers_', '_unique_fields_' and provides the function for converting the collection
+    type value (except str) to NamedTuple type.
     """
+    _named_sunder_names = frozenset(('_field_names_', '_indexes_', '_normalizers_',
+                                     '_unique_fields_'))
+    """The single underscore names used by the named enum classes."""
 
     def __setitem__(self, key: str, value: Any) -> None:
-        """Makes an exception for the single underscore name '_field_names_'.
+        """Makes an exception for the single underscore names '_field_names_',
+        '_indexes_', '_normalizers_' and '_unique_fields_'.
 
         Args:
             key (str): variable or function names defined in class.
             value (Any): values or functions.
         """
-        if key == '_field_names_':
+        if key in self._named_sunder_names:
             dict.__setitem__(self, key, value)
         else:
             super().__setitem__(key, value)
 
-    def _clean(self) -> None:
-        """Removes all the items, and set the variables '_member_names' and
-        '_last_values' to empty."""
-        # for dictionary, that's the only way to _clean it
-        for name in self._member_names:
-            del self[name]
-        # _clean the variables as well
-        tmp_dict = _EnumDict()
-        self._member_names = tmp_dict._member_names
-        self._last_values = tmp_dict._last_values
+    def _add_members(self, records: Iterable[Tuple[str, Any]]) -> None:
+        """Adds the enumeration items from the given records in one pass,
+        without the checks of `__setitem__` for the other kinds of names.
+
+        Args:
+            records (Iterable[Tuple[str, Any]]): pairs of the name and value of
+             each enumeration item.
+        """
+        _member_names = self._member_names
+        _last_values = self._last_values
+        # from python 3.11, '_member_names' is a dict instead of a list
+        names_as_dict = isinstance(_member_names, dict)
+        for name, value in records:
+            if not isinstance(name, str) or _is_sunder(name) or _is_dunder(name):
+                raise ValueError("Invalid name of enumeration item: %r." % (name, ))
+            if name in self:
+                raise TypeError("Attempted to reuse key: %r" % name)
+            dict.__setitem__(self, name, value)
+            if names_as_dict:
+                _member_names[name] = None
+            else:
+                _member_names.append(name)
+            _last_values.append(value)
 
     def _convert(self, tuple_cls: Type[NamedTuple]) -> None:
         """Uses the given tuple class to _convert the items.
 
+        Note:
+            The items are converted in a single pass and written back to the
+            dictionary directly, the variables '_member_names' and
+            '_last_values' keep their order.
+
         Args:
             tuple_cls (Type[NamedTuple]): using namedtuple generated tuple class.
         """
         if tuple_cls is tuple or not issubclass(tuple_cls, tuple):
             raise ValueError("'tuple_cls' must be a customized tuple class "
                              "using namedtuple generated class instead.")
-        _member_names = self._member_names
-        _last_values = []
+        _last_values = self._last_values
         feature_num = len(getattr(tuple_cls, '_fields'))
 
-        if feature_num == 1:
+        for i, name in enumerate(self._member_names):
+            value = _last_values[i]
             # converting the type of the value in customized tuple
-            for value in self._last_values:
-                _last_values.append(tuple_cls(value))
+            if feature_num == 1:
+                value = tuple_cls(value)
+            elif not isinstance(value, Sequence) or isinstance(value, str):
+                err_msg = "Unable to unpack the value '{}' as {} " \
+                          "for the fields.".format(value, tuple_cls.__name__)
+                raise ValueError(err_msg)
+            else:
+                value = tuple_cls(*value)
+            _last_values[i] = value
+            dict.__setitem__(self, name, value)
+
+
+_tuple_cls_cache: Dict[Tuple[str, ...], Type[NamedTuple]] = {}
+"""Cache of the customized tuple classes, the key is the normalized field
+names."""
+
+
+def _normalize_field_names(field_names: Union[str, Sequence]) -> Tuple[str, ...]:
+    """Normalizes the field names into a tuple of strings.
+
+    Args:
+        field_names (Union[str, Sequence]): field names in the same format as
+         the parameter `field_names` in function `namedtuple`.
+
+    Returns:
+        Tuple[str, ...]: field names as a tuple of strings.
+
+    Examples:
+        >>> _normalize_field_names("key, label")
+        ('key', 'label')
+        >>> _normalize_field_names(["key", "label"])
+        ('key', 'label')
+    """
+    if isinstance(field_names, str):
+        field_names = field_names.replace(',', ' ').split()
+    return tuple(map(str, field_names))
+
+
+def _get_tuple_cls(field_names: Union[str, Sequence]) -> Type[NamedTuple]:
+    """Returns the customized tuple class for the given field names. The tuple
+    class is created by `namedtuple` at the first time and shared by all the
+    enumeration classes with the same field names.
+
+    Args:
+        field_names (Union[str, Sequence]): field names in the same format as
+         the parameter `field_names` in function `namedtuple`.
+
+    Returns:
+        Type[NamedTuple]: customized tuple class.
+    """
+    key = _normalize_field_names(field_names)
+    try:
+        return _tuple_cls_cache[key]
+    except KeyError:
+        return _tuple_cls_cache.setdefault(key, namedtuple("NamedTuple", key))
+
+
+def _import_numpy() -> Any:
+    """Imports the optional dependency NumPy.
+
+    Returns:
+        Any: the module `numpy`.
+
+    Raises:
+        ImportError: if NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NumPy is required for the array conversions, "
+                          "install it with 'pip install named_enum[numpy]'.") from e
+    return numpy
+
+
+def _to_array(numpy: Any, values: Sequence) -> Any:
+    """Converts the values into a one-dimensional read-only NumPy array. The
+    dtype is inferred from the values, except the values of different types
+    would be coerced into strings or a value is a sequence, in which cases
+    the dtype `object` is used.
+
+    Args:
+        numpy (Any): the module `numpy`.
+        values (Sequence): values to convert.
+
+    Returns:
+        Any: a one-dimensional NumPy array.
+    """
+    try:
+        array = numpy.array(values)
+    except ValueError:
+        # sequences with different lengths
+        array = None
+    if array is None or array.ndim != 1 or \
+            (array.dtype.kind in "SU" and len(set(map(type, values))) > 1):
+        array = numpy.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            array[i] = value
+    array.flags.writeable = False
+    return array
+
+
+def _is_searchable(sorted_column: Any, values: Any) -> bool:
+    """Checks if the values can be searched in the sorted column by NumPy,
+    i.e. both of them are numeric, or strings of the same kind.
+
+    Args:
+        sorted_column (Any): sorted values of a field as a NumPy array, or
+         None if they aren't sortable.
+        values (Any): values to search as a NumPy array.
+
+    Returns:
+        bool: if the values can be searched.
+    """
+    if sorted_column is None or not sorted_column.size:
+        return False
+    column_kind = sorted_column.dtype.kind
+    values_kind = values.dtype.kind
+    if column_kind in 'biuf':
+        return values_kind in 'biuf'
+    return column_kind == values_kind and values_kind in 'SU'
+
+
+class _FieldProperty(property):
+    """Property returning the value of a field from the value of the
+    enumeration item."""
+
+    def __init__(self, field_name: str) -> None:
+        """Uses `attrgetter` as the getter, such that the value is fetched
+        without any Python level function call.
+
+        Args:
+            field_name (str): name of the field.
+        """
+        super().__init__(attrgetter('_value_.%s' % field_name))
+
+
+class _OrdinalProperty(property):
+    """Property returning the ordinal of the enumeration item, i.e. its
+    position in the definition order without the aliases. A field with the
+    same name takes precedence over it."""
+
+    def __init__(self) -> None:
+        """Uses `attrgetter` as the getter, such that the ordinal is fetched
+        without any Python level function call."""
+        super().__init__(attrgetter('_ordinal_'))
+
+
+class _FieldFunction:
+    """Non-data descriptor of a function of the fields, e.g. `keys`, which
+    creates the function on its first access. It only holds the name of the
+    function, so it's shared by all the enumeration classes."""
+    __slots__ = ('func_name', )
+
+    def __init__(self, func_name: str) -> None:
+        """
+        Args:
+            func_name (str): name of the function.
+        """
+        self.func_name = func_name
+
+    def __get__(self, instance: Any, owner: Any) -> Callable:
+        """Returns the function of the owner class.
+
+        Args:
+            instance (Any): enumeration item, if it's accessed from an item.
+            owner (Any): enumeration class.
+
+        Returns:
+            Callable: the function of the field.
+        """
+        func = owner._field_func(self.func_name)
+        if func is None:
+            # inherited from a parent class with other fields
+            raise AttributeError("type object %r has no attribute %r"
+                                 % (owner.__name__, self.func_name))
+        return func
+
+
+_field_function_cache: Dict[str, _FieldFunction] = {}
+"""Cache of the descriptors of the functions of the fields, the key is the
+name of the function."""
+
+
+def _get_field_function(func_name: str) -> _FieldFunction:
+    """Returns the descriptor of the function of the fields with the given
+    name, which is shared by all the enumeration classes.
+
+    Args:
+        func_name (str): name of the function.
+
+    Returns:
+        _FieldFunction: descriptor of the function.
+    """
+    try:
+        return _field_function_cache[func_name]
+    except KeyError:
+        return _field_function_cache.setdefault(func_name,
+                                                _FieldFunction(func_name))
+
+
+_unset = object()
+"""Marker of the not yet loaded indexes in the functions of the fields."""
+
+
+def _is_attr_taken(cls: Enum, attr_name: str,
+                   with_metaclass: Optional[bool] = True) -> bool:
+    """Checks if the attribute name is already taken by an enumeration item,
+    a definition in the class hierarchy other than the property `ordinal` and
+    the functions of the fields, or the metaclass, e.g. the function `values`.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        attr_name (str): name of the attribute.
+        with_metaclass (Optional[bool]): if the attributes of the metaclass
+         are taken into account.
+
+    Returns:
+        bool: if the attribute name is taken.
+    """
+    if attr_name in cls._member_map_:
+        return True
+    if with_metaclass and hasattr(type(cls), attr_name):
+        return True
+    for base in cls.__mro__:
+        attr = base.__dict__.get(attr_name, _unset)
+        if isinstance(attr, (_OrdinalProperty, _FieldFunction)):
+            continue
+        if attr is not _unset:
+            return True
+    return False
+
+
+def _make_field_values(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `<field_name>s` of the given enumeration class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the values of the field.
+    """
+    values = _unset
+
+    def field_values(as_tuple: Optional[bool] = True) -> Union[Tuple, Generator]:
+        nonlocal values
+        if values is _unset:
+            values = type(cls)._field_values(cls, field_name)
+        return values if as_tuple else (value for value in values)
+    return field_values
+
+
+def _make_from_field(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `from_<field_name>` of the given enumeration class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the enumeration items with the given
+        value of the field.
+    """
+    index = _unset
+
+    def from_field(field_value: Any,
+                   as_tuple: Optional[bool] = True) -> Union[Tuple, Generator]:
+        nonlocal index
+        if index is _unset:
+            index = cls._field_index(field_name)
+        if index is not None:
+            try:
+                items = index.get(field_value, ())
+            except TypeError:
+                pass
+            else:
+                return items if as_tuple else (item for item in items)
+        return type(cls)._from_field(cls, field_name, field_value, as_tuple)
+    return from_field
+
+
+def _make_has_field(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `has_<field_name>` of the given enumeration class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function checking if any enumeration item has the given
+        value of the field.
+    """
+    value_set = _unset
+
+    def has_field(field_value: Any) -> bool:
+        nonlocal value_set
+        if value_set is _unset:
+            value_set = cls._field_value_set(field_name)
+        if value_set is not None:
+            try:
+                return field_value in value_set
+            except TypeError:
+                pass
+        return type(cls)._has_field(cls, field_name, field_value)
+    return has_field
+
+
+def _make_from_field_many(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `from_<field_name>_many` of the given enumeration
+    class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the enumeration items for each of the
+        given values of the field.
+    """
+    index = _unset
+
+    def from_field_many(field_values: Iterable,
+                        missing: Optional[str] = "raise") -> Tuple:
+        nonlocal index
+        if missing not in ("raise", "skip", "none"):
+            raise ValueError("'missing' must be one of 'raise', 'skip' and "
+                             "'none', not %r." % (missing, ))
+        if index is _unset:
+            index = cls._field_index(field_name)
+        field_values = tuple(field_values)
+        results = None
+        if index is not None:
+            try:
+                results = [index.get(value, ()) for value in field_values]
+            except TypeError:
+                pass
+        if results is None:
+            results = [type(cls)._from_field(cls, field_name, value)
+                       for value in field_values]
+        if missing == "skip":
+            return tuple(items for items in results if items)
+        if missing == "none":
+            return tuple(items or None for items in results)
+        for value, items in zip(field_values, results):
+            if not items:
+                raise ValueError("%r is not a valid value of the field %r in "
+                                 "%s." % (value, field_name, cls.__name__))
+        return tuple(results)
+    return from_field_many
+
+
+def _make_has_field_many(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `has_<field_name>_many` of the given enumeration
+    class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function checking for each of the given values if any
+        enumeration item has it in the field.
+    """
+    value_set = _unset
+
+    def has_field_many(field_values: Iterable) -> Tuple:
+        nonlocal value_set
+        if value_set is _unset:
+            value_set = cls._field_value_set(field_name)
+        field_values = tuple(field_values)
+        if value_set is not None:
+            try:
+                return tuple([value in value_set for value in field_values])
+            except TypeError:
+                pass
+        return tuple([type(cls)._has_field(cls, field_name, value)
+                      for value in field_values])
+    return has_field_many
+
+
+def _load_sorted_index(cls: Enum, field_name: str) -> Tuple[List, Tuple]:
+    """Returns the sorted index of the field for the range functions.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Tuple[List, Tuple]: the sorted values and the enumeration items in
+        the same order.
+
+    Raises:
+        TypeError: if the values of the field are not orderable.
+    """
+    index = cls._sorted_index(field_name)
+    if index is None:
+        raise TypeError("The values of the field %r in %s are not orderable."
+                        % (field_name, cls.__name__))
+    return index
+
+
+def _make_field_compare(cls: Enum, field_name: str, bisect_func: Callable,
+                        before: bool) -> Callable:
+    """Creates one of the functions `<field_name>_lt`, `<field_name>_le`,
+    `<field_name>_gt` and `<field_name>_ge` of the given enumeration class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+        bisect_func (Callable): `bisect_left` or `bisect_right`, which finds
+         the boundary of the result in the sorted values.
+        before (bool): returns the enumeration items before the boundary if
+         True; otherwise the ones after it.
+
+    Returns:
+        Callable: function returning the enumeration items, whose values of
+        the field compare to the given value.
+    """
+    index = _unset
+
+    def field_compare(field_value: Any) -> Tuple:
+        nonlocal index
+        if index is _unset:
+            index = _load_sorted_index(cls, field_name)
+        values, items = index
+        position = bisect_func(values, field_value)
+        return items[:position] if before else items[position:]
+    return field_compare
+
+
+def _make_field_between(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `<field_name>_between` of the given enumeration
+    class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the enumeration items, whose values of
+        the field are in the given range.
+    """
+    index = _unset
+
+    def field_between(low: Any, high: Any) -> Tuple:
+        nonlocal index
+        if index is _unset:
+            index = _load_sorted_index(cls, field_name)
+        values, items = index
+        return items[bisect_left(values, low):bisect_right(values, high)]
+    return field_between
+
+
+def _make_field_nearest(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `<field_name>_nearest` of the given enumeration
+    class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the enumeration items, whose value of
+        the field is the nearest one to the given value. Between two values
+        of the field, the distances are computed by subtraction, which raises
+        a TypeError for the non-numeric values.
+    """
+    index = _unset
+
+    def field_nearest(field_value: Any) -> Tuple:
+        nonlocal index
+        if index is _unset:
+            index = _load_sorted_index(cls, field_name)
+        values, items = index
+        if not values:
+            return ()
+        position = bisect_left(values, field_value)
+        if position < len(values) and not field_value < values[position]:
+            # exact match
+            nearest = values[position]
+        elif position == 0:
+            nearest = values[0]
+        elif position == len(values):
+            nearest = values[-1]
         else:
-            # converting the type of the value in customized tuple
-            for value in self._last_values:
-                if not isinstance(value, Sequence) or isinstance(value, str):
-                    err_msg = "Unable to unpack the value '{}' as {} " \
-                              "for the fields.".format(value, tuple_cls.__name__)
-                    raise ValueError(err_msg)
-                else:
-                    _last_values.append(tuple_cls(*value))
-        self._clean()
+            lower, upper = values[position - 1], values[position]
+            try:
+                lower_distance = field_value - lower
+                upper_distance = upper - field_value
+            except TypeError:
+                raise TypeError("The values of the field %r in %s are not numeric."
+                                % (field_name, cls.__name__)) from None
+            # the smaller value wins the tie
+            nearest = lower if lower_distance <= upper_distance else upper
+        return items[bisect_left(values, nearest):bisect_right(values, nearest)]
+    return field_nearest
+
+
+_max_char = chr(_sys.maxunicode)
+"""The largest character, which can't be incremented."""
+
+
+def _make_field_startswith(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `<field_name>_startswith` of the given enumeration
+    class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the enumeration items, whose values of
+        the field start with the given prefix. It raises a TypeError, if the
+        prefix or the values of the field are not strings.
+    """
+    index = _unset
+
+    def field_startswith(prefix: str, limit: Optional[int] = None) -> Tuple:
+        nonlocal index
+        if index is _unset:
+            sorted_index = _load_sorted_index(cls, field_name)
+            if not all(isinstance(value, str) for value in sorted_index[0]):
+                raise TypeError("The values of the field %r in %s are not strings."
+                                % (field_name, cls.__name__))
+            index = sorted_index
+        if not isinstance(prefix, str):
+            raise TypeError("The prefix of the field %r in %s must be a string, "
+                            "not %r." % (field_name, cls.__name__, prefix))
+        values, items = index
+        start = bisect_left(values, prefix)
+        if not prefix:
+            end = len(values)
+        elif prefix[-1] != _max_char:
+            # all the strings starting with the prefix are less than the
+            # prefix with its last character incremented
+            end = bisect_left(values, prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+        else:
+            end = start
+            while end < len(values) and values[end].startswith(prefix):
+                end += 1
+        if limit is not None:
+            end = min(end, start + max(limit, 0))
+        return items[start:end]
+    return field_startswith
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    """Returns the trigrams of the case folded text, which is padded with two
+    spaces in front and one space behind, the inner whitespaces are collapsed
+    to one space.
+
+    Args:
+        text (str): text to split.
+
+    Returns:
+        FrozenSet[str]: the trigrams of the text.
+    """
+    text = "  %s " % " ".join(text.casefold().split())
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def _make_fuzzy_field(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `fuzzy_<field_name>` of the given enumeration
+    class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the enumeration items, whose values of
+        the field are similar to the given text.
+    """
+    index = _unset
+
+    def fuzzy_field(text: str, limit: Optional[int] = 5,
+                    min_score: float = 0.3) -> Tuple:
+        nonlocal index
+        if index is _unset:
+            index = cls._trigram_index(field_name)
+            if index is None:
+                raise TypeError("The values of the field %r in %s are not strings."
+                                % (field_name, cls.__name__))
+        postings, gram_counts, items = index
+        grams = _trigrams(text)
+        gram_count = len(grams)
+        # count the common trigrams of each value sharing at least one
+        common_counts = Counter(chain.from_iterable(
+            postings[gram] for gram in grams if gram in postings))
+        candidates = []
+        for value_id, common_count in common_counts.items():
+            score = common_count / (gram_count + gram_counts[value_id] - common_count)
+            if score >= min_score:
+                # the earlier defined value wins on the same score
+                candidates.append((score, -value_id))
+        if limit is None:
+            candidates.sort(reverse=True)
+        else:
+            limit = max(limit, 0)
+            candidates = nlargest(limit, candidates)
+        return tuple(islice(chain.from_iterable(items[-value_id]
+                                                for _, value_id in candidates),
+                            limit))
+    return fuzzy_field
+
 
-        # put the converted items back, the __setitem__ function in _EnumDict
-        # will fill the variables, like '_member_names' and '_last_values'
-        for i, name in enumerate(_member_names):
-            self[name] = _last_values[i]
+def _make_from_field_normalized(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `from_<field_name>_normalized` of the given
+    enumeration class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the enumeration items, whose normalized
+        value of the field equals the normalized given value.
+    """
+    normalizer = index = _unset
+
+    def from_field_normalized(field_value: Any) -> Tuple:
+        nonlocal normalizer, index
+        if index is _unset:
+            normalizer = cls._normalizers()[field_name]
+            index = cls._normalized_index(field_name)
+        try:
+            return index.get(normalizer(field_value), ())
+        except (TypeError, ValueError):
+            # the value can't be normalized or is unhashable, like a miss of
+            # the function `from_<field_name>`
+            return ()
+    return from_field_normalized
+
+
+def _make_get_by_field(cls: Enum, field_name: str) -> Callable:
+    """Creates the function `get_by_<field_name>` of the given enumeration
+    class.
+
+    Args:
+        cls (Enum): subclass of NamedEnum class.
+        field_name (str): attribute's name.
+
+    Returns:
+        Callable: function returning the enumeration item with the given
+        value of the unique field.
+    """
+    index = _unset
+
+    def get_by_field(field_value: Any, default: Any = None) -> Any:
+        nonlocal index
+        if index is _unset:
+            index = cls._unique_index(field_name)
+        try:
+            return index.get(field_value, default)
+        except TypeError:
+            return default
+    return get_by_field
+
+
+_field_func_factories = [
+    ("%ss",
+     "Collective method to return the values of the attribute `%s` "
+     "from all the enumeration items.",
+     _make_field_values),
+    ("from_%s",
+     "Returns a tuple of the defined enumeration items regarding to "
+     "the given `field_value` of field `%s`, if `as_tuple` is True; "
+     "otherwise returns a generator.",
+     _make_from_field),
+    ("has_%s",
+     "Returns a boolean value which indicates if there is at least "
+     "one enumeration item in which the value of the field `%s` "
+     "matches the given field_value.",
+     _make_has_field),
+    ("from_%s_many",
+     "Returns a tuple containing the result of `from_%s` for each of the "
+     "given `field_values` in the same order. The parameter `missing` "
+     "controls the values without enumeration items: 'raise' raises a "
+     "ValueError, 'skip' leaves them out and 'none' gives None for them.",
+     _make_from_field_many),
+    ("has_%s_many",
+     "Returns a tuple containing the result of `has_%s` for each of the "
+     "given `field_values` in the same order.",
+     _make_has_field_many),
+    ("%s_lt",
+     "Returns a tuple of the enumeration items, whose values of the field "
+     "`%s` are less than the given `field_value`, sorted by the values.",
+     partial(_make_field_compare, bisect_func=bisect_left, before=True)),
+    ("%s_le",
+     "Returns a tuple of the enumeration items, whose values of the field "
+     "`%s` are less than or equal to the given `field_value`, sorted by the "
+     "values.",
+     partial(_make_field_compare, bisect_func=bisect_right, before=True)),
+    ("%s_gt",
+     "Returns a tuple of the enumeration items, whose values of the field "
+     "`%s` are greater than the given `field_value`, sorted by the values.",
+     partial(_make_field_compare, bisect_func=bisect_right, before=False)),
+    ("%s_ge",
+     "Returns a tuple of the enumeration items, whose values of the field "
+     "`%s` are greater than or equal to the given `field_value`, sorted by "
+     "the values.",
+     partial(_make_field_compare, bisect_func=bisect_left, before=False)),
+    ("%s_between",
+     "Returns a tuple of the enumeration items, whose values of the field "
+     "`%s` are between `low` and `high` inclusively, sorted by the values.",
+     _make_field_between),
+    ("%s_nearest",
+     "Returns a tuple of the enumeration items, whose value of the field "
+     "`%s` is the nearest one to the given `field_value`. The smaller value "
+     "wins if two values are equally near.",
+     _make_field_nearest),
+    ("%s_startswith",
+     "Returns a tuple of the enumeration items, whose values of the field "
+     "`%s` start with the given `prefix`, sorted by the values. At most "
+     "`limit` items are returned, if it's given.",
+     _make_field_startswith),
+    ("fuzzy_%s",
+     "Returns a tuple of the enumeration items, whose values of the field "
+     "`%s` are the most similar ones to the given `text`, ranked by the "
+     "similarity of their trigrams. At most `limit` items are returned, "
+     "whose similarities are at least `min_score`.",
+     _make_fuzzy_field)
+]
+"""The function name formats, docstring formats and factories for creating
+the functions of each field."""
+
+_declared_field_func_factories = [
+    ("from_%s_normalized",
+     "Returns a tuple of the enumeration items, whose values of the field "
+     "`%s` are equal to the given `field_value` after applying the "
+     "normalizer of the field to both of them. It returns an empty tuple, if "
+     "the normalizer raises a TypeError or ValueError for the given value.",
+     _make_from_field_normalized, "_normalizers"),
+    ("get_by_%s",
+     "Returns the enumeration item with the given `field_value` of the "
+     "unique field `%s`, or `default` if there isn't such item.",
+     _make_get_by_field, "_unique_fields")
+]
+"""The function name formats, docstring formats and factories for creating
+the functions of the fields declared by a class variable, with the name of
+the class method returning the declared fields."""
 
 
 class NamedEnumMeta(EnumMeta):
@@ -86,14 +839,16 @@ class NamedEnumMeta(EnumMeta):
 
     2.  provides extra functions, which is independent of the variable
     `_field_names_`, such as `names`, `values`, `as_dict`, `as_list`, `as_set`,
-    `as_tuple`, `as_ordereddict`, `describe`, `gen`. The aim is extending the
+    `as_tuple`, `as_ordereddict`, `as_mapping`, `as_frozenset`, `describe`,
+    `gen`. The aim is extending the
     Enum class for complicated use cases in software development.
 
     3.  provides functions for each field name defined in class variable
     `_field_names_` in the NamedEnum class and its subclasses, for example:
 
     assuming `'key'` is included in `_field_names_`, then the functions for this
-    field name are: `keys`, `from_key`, `has_key`.
+    field name are: `keys`, `from_key`, `has_key`, `from_key_many`,
+    `has_key_many`.
     """
     @classmethod
     def __prepare__(mcs, cls: str, bases: Tuple) -> _NamedEnumDict:
@@ -124,8 +879,9 @@ class NamedEnumMeta(EnumMeta):
     def __new__(mcs, name: str, bases: Tuple, namespace: _NamedEnumDict) -> ClassVar:
         """Besides the class creation, this function also intends to create a
         named tuple data type depending on the given value of '_field_names_'
-        variable to be the data type of the value of enumeration iem and add
-        those extra functions to the class.
+        variable to be the data type of the value of enumeration iem and
+        install the properties of the fields to the class. The extra functions
+        of the fields are installed as descriptors, which create them lazily.
 
         Args:
             name (str): name of the instance class.
@@ -145,49 +901,200 @@ class NamedEnumMeta(EnumMeta):
         # if the _field_names_ is not defined, then switch back to the normal
         # enum but with extended functions
         if _field_names_:
-            # created the customized tuple class with the defined _field_names_
-            _tuple_cls = namedtuple("NamedTuple", _field_names_)
+            # get the customized tuple class with the defined _field_names_
+            _tuple_cls = _get_tuple_cls(_field_names_)
             if {"name", "value"}.issubset(_tuple_cls._fields):
                 raise AttributeError("'name' or 'value' cannot be attributes")
             # _convert the type of the item in namespace dictionary to the named
             # tuple type
             namespace._convert(_tuple_cls)
-            # create the class and define a class variable to hold the
-            # customized tuple class. It's needed to return the field names.
+            # define a class variable to hold the customized tuple class. It's
+            # needed to return the field names, even during the creation of the
+            # enumeration items. It bypasses `__setitem__`, which would take it
+            # for an enumeration item.
+            dict.__setitem__(namespace, '_tuple_cls', _tuple_cls)
             cls = super().__new__(mcs, name, bases, namespace)
-            cls._tuple_cls = _tuple_cls
-            # the function name formats, docstring formats and bases functions
-            func_factory_mapping = [
-                ("%ss",
-                 "Collective method to return the values of the attribute `%s` "
-                 "from all the enumeration items.",
-                 mcs._field_values),
-                ("from_%s",
-                 "Returns a tuple of the defined enumeration items regarding to "
-                 "the given `field_value` of field `%s`, if `as_tuple` is True; "
-                 "otherwise returns a generator.",
-                 mcs._from_field),
-                ("has_%s",
-                 "Returns a boolean value which indicates if there is at least "
-                 "one enumeration item in which the value of the field `%s` "
-                 "matches the given field_value.",
-                 mcs._has_field)
-            ]
-            # function creation factory: create functions for each field_name
+            # install a property for each field on the class, such that the
+            # field's value is returned by a plain attribute lookup, instead of
+            # going through the `__getattr__` function of the member. The names
+            # already taken, e.g. members or the functions of the metaclass, are
+            # left untouched, except the property `ordinal`. The values of those
+            # fields are still returned by `__getattr__` of the member.
             for field_name in cls._fields():
-                for name, docstring, mcs_func in func_factory_mapping:
-                    func_name = name % field_name
-                    func_docstring = docstring % field_name
-                    setattr(cls, func_name, partial(mcs_func, cls, field_name))
-                    # override the docstring of the partial function
-                    par_func = getattr(cls, func_name)
-                    par_func.__doc__ = func_docstring
-                    par_func.__name__ = func_name
-            cls._tuple_cls = _tuple_cls
+                if not _is_attr_taken(cls, field_name):
+                    type.__setattr__(cls, field_name, _FieldProperty(field_name))
+            # install a descriptor for each function of the fields, which
+            # creates the function on its first access. The descriptors in the
+            # class take precedence over the functions of the metaclass with
+            # the same names, e.g. `from_records` of a field named `records`.
+            for func_name in cls._iter_field_func_names():
+                if not _is_attr_taken(cls, func_name, with_metaclass=False):
+                    type.__setattr__(cls, func_name,
+                                     _get_field_function(func_name))
         else:
             cls = super().__new__(mcs, name, bases, namespace)
+        # drop the values cached during the creation of the enumeration items,
+        # e.g. by their `__init__`, which only see a part of the items
+        if '_cache_' in cls.__dict__:
+            type.__delattr__(cls, '_cache_')
+        # install the property `ordinal` from here instead of the body of
+        # `NamedEnum`, where type checkers would take it for an enumeration
+        # item. A field or any other definition of the name takes precedence.
+        if not _is_attr_taken(cls, 'ordinal'):
+            type.__setattr__(cls, 'ordinal', _OrdinalProperty())
+        # validate the declared composite indexes
+        if namespace.get('_indexes_'):
+            cls._composite_indexes()
+        # the ordinal of an enumeration item is its position in the definition
+        # order, the aliases share the ordinal of their canonical items
+        member_map = cls._member_map_
+        for ordinal, member_name in enumerate(cls._member_names_):
+            member_map[member_name]._ordinal_ = ordinal
+        # validate the declared normalizers and build the normalized indexes,
+        # such that the values of the fields are normalized only once
+        if getattr(cls, '_normalizers_', None):
+            normalizers = cls._normalizers()
+            if member_map:
+                for field_name in normalizers:
+                    cls._normalized_index(field_name)
+        # validate the declared unique fields and reject the duplicate values
+        # by building their indexes
+        if getattr(cls, '_unique_fields_', None):
+            unique_fields = cls._unique_fields()
+            if member_map:
+                for field_name in unique_fields:
+                    cls._unique_index(field_name)
         return cls
 
+    def _iter_field_func_names(cls) -> Iterator[str]:
+        """Yields the names of all the functions of the fields, without
+        creating the functions or their docstrings.
+
+        Returns:
+            Iterator[str]: names of the functions of the fields.
+        """
+        for field_name in cls._fields():
+            for name_format, _, _ in _field_func_factories:
+                yield name_format % field_name
+        for name_format, _, _, fields_getter in _declared_field_func_factories:
+            # the fields are declared by the class variable named after the
+            # class method with a trailing underscore, e.g. `_normalizers_`
+            if getattr(cls, fields_getter + '_', None):
+                for field_name in getattr(cls, fields_getter)():
+                    yield name_format % field_name
+
+    def _field_func_names(cls) -> Dict[str, Tuple[str, str, Callable]]:
+        """Returns the names of all the functions of the fields.
+
+        Returns:
+            Dict[str, Tuple[str, str, Callable]]: function name to the field
+            name, the docstring and the factory of the function mapping.
+        """
+        def build() -> Dict[str, Tuple[str, str, Callable]]:
+            func_names = {
+                name_format % field_name: (field_name,
+                                           docstring.replace("%s", field_name),
+                                           factory)
+                for field_name in cls._fields()
+                for name_format, docstring, factory in _field_func_factories
+            }
+            for name_format, docstring, factory, fields_getter in \
+                    _declared_field_func_factories:
+                for field_name in getattr(cls, fields_getter)():
+                    func_names[name_format % field_name] = (
+                        field_name, docstring.replace("%s", field_name), factory)
+            return func_names
+        return cls._cached('field_func_names', build)
+
+    def _field_func(cls, func_name: str) -> Optional[Callable]:
+        """Returns the function of a field with the given name, e.g. `keys`,
+        `from_key`, `has_key` for the field `key`.
+
+        Note:
+            The function is created at the first call as a closure bound to
+            the enumeration class and the field, which loads the index of the
+            field once. For the enumeration classes having items, it's also
+            set to the class in place of its descriptor, such that the
+            following accesses are normal attribute lookups. The enumeration
+            classes without items can still be inherited, so the function is
+            only cached for them.
+
+        Args:
+            func_name (str): name of the function.
+
+        Returns:
+            Optional[Callable]: the function, or `None` if there isn't any
+            function of the fields with the given name.
+        """
+        func_names = cls._field_func_names()
+        if func_name not in func_names:
+            return None
+
+        def build() -> Callable:
+            field_name, func_docstring, factory = func_names[func_name]
+            func = factory(cls, field_name)
+            func.__doc__ = func_docstring
+            func.__name__ = func_name
+            func.__qualname__ = "%s.%s" % (cls.__qualname__, func_name)
+            func.__module__ = cls.__module__
+            own_attr = cls.__dict__.get(func_name)
+            if cls._member_map_ and isinstance(own_attr, _FieldFunction):
+                # staticmethod keeps the function unbound when it's accessed
+                # from the enumeration items
+                type.__setattr__(cls, func_name, staticmethod(func))
+            return func
+        return cls._cached(('field_func', func_name), build)
+
+    def from_records(cls, name: str, records: Iterable[Tuple[str, Any]], *,
+                     module: Optional[str] = None) -> ClassVar:
+        """Creates a subclass of the enumeration class with the given name and
+        the enumeration items from the given records.
+
+        Note:
+            The records are consumed in a single pass, which can be a generator,
+            such that the items don't need to be collected in a class body
+            before. The values can't be `auto()`.
+
+            If a field is named `records`, the function `from_records` of the
+            field takes precedence over it, then the classes can still be
+            created by `NamedEnumMeta.from_records(cls, name, records)`.
+
+        Args:
+            name (str): name of the class to create.
+            records (Iterable[Tuple[str, Any]]): pairs of the name and value of
+             each enumeration item, in which the value is converted to the named
+             tuple of the class.
+            module (Optional[str]): which module the new created enum class
+             belongs to.
+
+        Returns:
+            ClassVar: class object
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            >>> Triangle = TripleEnum.from_records(
+            ...     "Triangle", (("EQUILATERAL", (6, 6, 6)), ("RIGHT", (3, 4, 5))))
+            >>> Triangle
+            <named enum 'Triangle'>
+            >>> Triangle.RIGHT
+            <Triangle.RIGHT: NamedTuple(first=3, second=4, third=5)>
+        """
+        metacls = type(cls)
+        bases = (cls, )
+        namespace = metacls.__prepare__(name, bases)
+        # For pickling to work, the __module__ variable needs to be set to the
+        # frame where the enum class is created.
+        if module is None:
+            try:
+                module = _sys._getframe(1).f_globals.get('__name__', '__main__')
+            except (AttributeError, ValueError):
+                module = name
+        namespace['__module__'] = module
+        namespace['__qualname__'] = name
+        namespace._add_members(records)
+        return metacls(name, bases, namespace)
+
     def __contains__(cls, member: Union[str, Enum]) -> bool:
         """verrides the magic method in Enum class, which doesn't support
         member name search from python 3.8.
@@ -228,6 +1135,330 @@ class NamedEnumMeta(EnumMeta):
             return cls._tuple_cls._fields
         return tuple()
 
+    def _cached(cls, key: Any, factory: Callable[[], Any]) -> Any:
+        """Returns the value cached under the given key for the enumeration
+        class, calls `factory` to create it at the first time.
+
+        Note:
+            The cache is stored in the class's own `__dict__`, such that a
+            subclass never sees the cached values of its parent class.
+
+        Args:
+            key (Any): key of the cached value.
+            factory (Callable[[], Any]): function creating the value.
+
+        Returns:
+            Any: cached value.
+        """
+        cache = cls.__dict__.get('_cache_')
+        if cache is None:
+            cache = {}
+            type.__setattr__(cls, '_cache_', cache)
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = factory()
+            return value
+
+    def _field_index(cls, field_name: str) -> Optional[Dict[Any, Tuple]]:
+        """Returns a hash index of the field `field_name`, which maps each
+        value of the field to the `tuple` of enumeration items holding it.
+
+        Note:
+            The index is built once at the first call. If any value of the
+            field is unhashable, `None` is returned and the callers fall back
+            to scan the enumeration items.
+
+        Args:
+            field_name (str): attribute's name.
+
+        Returns:
+            Optional[Dict[Any, Tuple]]: value to enumeration items mapping.
+        """
+        def build() -> Optional[Dict[Any, Tuple]]:
+            index: Dict[Any, List] = {}
+            getter = itemgetter(cls._fields().index(field_name))
+            try:
+                for item in cls._member_map_.values():
+                    index.setdefault(getter(item._value_), []).append(item)
+            except TypeError:
+                return None
+            return {value: tuple(items) for value, items in index.items()}
+        return cls._cached(('index', field_name), build)
+
+    def _sorted_index(cls, field_name: str) -> Optional[Tuple[List, Tuple]]:
+        """Returns a sorted index of the field `field_name` for the range
+        queries, e.g. `<field_name>_between`.
+
+        Note:
+            The index is built once at the first call. The enumeration items
+            with equal values keep the definition order. If the values of the
+            field are not orderable, `None` is returned.
+
+        Args:
+            field_name (str): attribute's name.
+
+        Returns:
+            Optional[Tuple[List, Tuple]]: the sorted values and the
+            enumeration items in the same order.
+        """
+        def build() -> Optional[Tuple[List, Tuple]]:
+            getter = itemgetter(cls._fields().index(field_name))
+            items = list(cls._member_map_.values())
+            try:
+                items.sort(key=lambda item: getter(item._value_))
+            except TypeError:
+                return None
+            return [getter(item._value_) for item in items], tuple(items)
+        return cls._cached(('sorted_index', field_name), build)
+
+    def _composite_indexes(cls) -> Tuple[Tuple[str, ...], ...]:
+        """Returns the field names of the composite indexes declared by the
+        variable `_indexes_`.
+
+        Returns:
+            Tuple[Tuple[str, ...], ...]: field names of each composite index.
+
+        Raises:
+            ValueError: if any field name isn't a field of the enumeration, or
+             the indexes are given as a bare string or a sequence of single
+             field names, e.g. `("first", "second")` instead of
+             `[("first", "second")]`.
+        """
+        def build() -> Tuple[Tuple[str, ...], ...]:
+            fields = cls._fields()
+            declared = cls._indexes_ or ()
+            if isinstance(declared, str):
+                indexes: Tuple[Tuple[str, ...], ...] = ()
+                single_names = [True]
+            else:
+                indexes = tuple(map(_normalize_field_names, declared))
+                # the indexes given as bare field names, e.g. ("first", "second")
+                single_names = [isinstance(index, str) and len(index_fields) == 1
+                                for index, index_fields in zip(declared, indexes)]
+            if single_names and all(single_names):
+                raise ValueError("The indexes of %s must be a sequence of the field names "
+                                 "of each index, e.g. [(\"first\", \"second\")], not %r."
+                                 % (cls.__name__, cls._indexes_))
+            for index_fields in indexes:
+                for field_name in index_fields:
+                    if field_name not in fields:
+                        raise ValueError("%r is not a field of %s." % (field_name, cls.__name__))
+            return indexes
+        return cls._cached('composite_indexes', build)
+
+    def _composite_index(cls, field_names: Tuple[str, ...]) -> Optional[Dict[Tuple, Tuple]]:
+        """Returns a hash index of the given fields, which maps each
+        combination of the values of the fields to the `tuple` of enumeration
+        items holding it.
+
+        Note:
+            The index is built once at the first call. If any value of the
+            fields is unhashable, `None` is returned.
+
+        Args:
+            field_names (Tuple[str, ...]): names of the fields.
+
+        Returns:
+            Optional[Dict[Tuple, Tuple]]: values to enumeration items mapping.
+        """
+        def build() -> Optional[Dict[Tuple, Tuple]]:
+            index: Dict[Tuple, List] = {}
+            fields = cls._fields()
+            indices = [fields.index(field_name) for field_name in field_names]
+            try:
+                for item in cls._member_map_.values():
+                    values = tuple(item._value_[i] for i in indices)
+                    index.setdefault(values, []).append(item)
+            except TypeError:
+                return None
+            return {values: tuple(items) for values, items in index.items()}
+        return cls._cached(('composite_index', field_names), build)
+
+    def _trigram_index(cls, field_name: str) -> Optional[Tuple[Dict[str, Tuple[int, ...]],
+                                                               Tuple[int, ...], Tuple[Tuple, ...]]]:
+        """Returns an inverted trigram index of the field `field_name` for the
+        function `fuzzy_<field_name>`.
+
+        Note:
+            The index is built once at the first call over the distinct values
+            of the field, which are numbered in the definition order. If any
+            value of the field isn't a `str`, `None` is returned.
+
+        Args:
+            field_name (str): attribute's name.
+
+        Returns:
+            Optional[Tuple[Dict[str, Tuple[int, ...]], Tuple[int, ...], Tuple[Tuple, ...]]]:
+            the numbers of the values containing each trigram, the number of
+            trigrams of each value and the enumeration items of each value.
+        """
+        def build() -> Optional[Tuple[Dict[str, Tuple[int, ...]],
+                                      Tuple[int, ...], Tuple[Tuple, ...]]]:
+            index = cls._field_index(field_name)
+            if index is None or not all(isinstance(value, str) for value in index):
+                return None
+            postings: Dict[str, List[int]] = {}
+            gram_counts = []
+            for value_id, value in enumerate(index):
+                grams = _trigrams(value)
+                gram_counts.append(len(grams))
+                for gram in grams:
+                    postings.setdefault(gram, []).append(value_id)
+            return ({gram: tuple(value_ids) for gram, value_ids in postings.items()},
+                    tuple(gram_counts), tuple(index.values()))
+        return cls._cached(('trigram_index', field_name), build)
+
+    def _normalizers(cls) -> Dict[str, Callable]:
+        """Returns the normalizers of the fields declared by the variable
+        `_normalizers_`.
+
+        Returns:
+            Dict[str, Callable]: field name to normalizer mapping.
+
+        Raises:
+            ValueError: if any field name isn't a field of the enumeration.
+            TypeError: if any normalizer isn't callable.
+        """
+        def build() -> Dict[str, Callable]:
+            fields = cls._fields()
+            normalizers = dict(getattr(cls, '_normalizers_', None) or {})
+            for field_name, normalizer in normalizers.items():
+                if field_name not in fields:
+                    raise ValueError("%r is not a field of %s." % (field_name, cls.__name__))
+                if not callable(normalizer):
+                    raise TypeError("The normalizer %r of the field %r in %s is not callable."
+                                    % (normalizer, field_name, cls.__name__))
+            return normalizers
+        return cls._cached('normalizers', build)
+
+    def _normalized_index(cls, field_name: str) -> Dict[Any, Tuple]:
+        """Returns a hash index of the field `field_name`, which maps each
+        normalized value of the field to the `tuple` of enumeration items
+        holding it.
+
+        Note:
+            The index is built once at the class creation, the normalizer of
+            the field is called once for each enumeration item.
+
+        Args:
+            field_name (str): attribute's name.
+
+        Returns:
+            Dict[Any, Tuple]: normalized value to enumeration items mapping.
+
+        Raises:
+            TypeError: if any normalized value is unhashable.
+        """
+        def build() -> Dict[Any, Tuple]:
+            index: Dict[Any, List] = {}
+            normalizer = cls._normalizers()[field_name]
+            getter = itemgetter(cls._fields().index(field_name))
+            for item in cls._member_map_.values():
+                index.setdefault(normalizer(getter(item._value_)), []).append(item)
+            return {value: tuple(items) for value, items in index.items()}
+        return cls._cached(('normalized_index', field_name), build)
+
+    def _unique_fields(cls) -> Tuple[str, ...]:
+        """Returns the names of the unique fields declared by the variable
+        `_unique_fields_`.
+
+        Returns:
+            Tuple[str, ...]: names of the unique fields.
+
+        Raises:
+            ValueError: if any field name isn't a field of the enumeration.
+        """
+        def build() -> Tuple[str, ...]:
+            fields = cls._fields()
+            unique_fields = _normalize_field_names(getattr(cls, '_unique_fields_', None) or ())
+            for field_name in unique_fields:
+                if field_name not in fields:
+                    raise ValueError("%r is not a field of %s." % (field_name, cls.__name__))
+            return unique_fields
+        return cls._cached('unique_fields', build)
+
+    def _unique_index(cls, field_name: str) -> Dict[Any, Enum]:
+        """Returns a hash index of the unique field `field_name`, which maps
+        each value of the field to the enumeration item holding it.
+
+        Note:
+            The index is built once at the class creation, the aliases are
+            skipped.
+
+        Args:
+            field_name (str): attribute's name.
+
+        Returns:
+            Dict[Any, Enum]: value to enumeration item mapping.
+
+        Raises:
+            ValueError: if any value of the field is held by more than one
+             enumeration item.
+            TypeError: if any value of the field is unhashable.
+        """
+        def build() -> Dict[Any, Enum]:
+            index: Dict[Any, Enum] = {}
+            getter = itemgetter(cls._fields().index(field_name))
+            for item in cls._ordinal_members():
+                value = getter(item._value_)
+                if index.setdefault(value, item) is not item:
+                    raise ValueError("%r is a duplicate value of the unique field %r in %s, "
+                                     "held by %s and %s."
+                                     % (value, field_name, cls.__name__,
+                                        index[value]._name_, item._name_))
+            return index
+        return cls._cached(('unique_index', field_name), build)
+
+    def _any_index(cls) -> Dict[Any, Tuple[Tuple[str, Enum], ...]]:
+        """Returns an inverted index of the names and the values of all the
+        fields, which maps each of them to the `tuple` of pairs of the field
+        name and the enumeration item holding it.
+
+        Note:
+            The index is built once at the first call. The pairs of each value
+            are ordered by the priority: the name of the enumeration item
+            first with the field name `'name'`, then the fields in the order
+            of `_fields()`, each in the definition order of the enumeration
+            items. The aliases are only indexed by their names. The
+            unhashable values of the fields are skipped.
+
+        Returns:
+            Dict[Any, Tuple[Tuple[str, Enum], ...]]: value to the pairs of the
+            field name and enumeration item mapping.
+        """
+        def build() -> Dict[Any, Tuple[Tuple[str, Enum], ...]]:
+            index: Dict[Any, List[Tuple[str, Enum]]] = {}
+            for name, item in cls._member_map_.items():
+                index.setdefault(name, []).append(('name', item))
+            members = cls._ordinal_members()
+            for i, field_name in enumerate(cls._fields()):
+                for item in members:
+                    try:
+                        index.setdefault(item._value_[i], []).append((field_name, item))
+                    except TypeError:
+                        continue
+            return {value: tuple(pairs) for value, pairs in index.items()}
+        return cls._cached('any_index', build)
+
+    def _field_value_set(cls, field_name: str) -> Optional[FrozenSet]:
+        """Returns a `frozenset` of the values of the field `field_name`.
+
+        Note:
+            The set is built once from the hash index of the field. `None` is
+            returned, if any value of the field is unhashable.
+
+        Args:
+            field_name (str): attribute's name.
+
+        Returns:
+            Optional[FrozenSet]: values of the field.
+        """
+        def build() -> Optional[FrozenSet]:
+            index = cls._field_index(field_name)
+            return None if index is None else frozenset(index)
+        return cls._cached(('value_set', field_name), build)
+
     @classmethod
     def _field_values(mcs, cls: Enum, field_name: str,
                       as_tuple: Optional[bool] = True) -> Union[Tuple, Generator]:
@@ -236,7 +1467,8 @@ class NamedEnumMeta(EnumMeta):
 
         Note:
             It's used to generate the particular function with name format
-            `<field_name>s` for each `field_name`.
+            `<field_name>s` for each `field_name`. The `tuple` is built once
+            and the same object is returned for the following calls.
 
         Args:
             cls (Enum): subclass of NamedEnum class.
@@ -248,9 +1480,11 @@ class NamedEnumMeta(EnumMeta):
             Union[Tuple, Generator]: corresponding values of the field name in
             all enumeration items
         """
-        g = (getattr(item.value, field_name)
-             for item in cls.gen(name_value_pair=False))
-        return tuple(g) if as_tuple else g
+        values = cls._cached(
+            ('values', field_name),
+            lambda: tuple(map(itemgetter(cls._fields().index(field_name)),
+                              NamedEnumMeta.values(cls))))
+        return values if as_tuple else (value for value in values)
 
     @classmethod
     def _from_field(mcs, cls: Enum, field_name: str, field_value: Any,
@@ -259,6 +1493,11 @@ class NamedEnumMeta(EnumMeta):
         regarding to the given `field_value` of field with `field_name`, if
         `as_tuple` is True; otherwise returns a generator.
 
+        Note:
+            The items are looked up in the hash index of the field. It falls
+            back to scan all the enumeration items, if the values of the field
+            or the given `field_value` are unhashable.
+
         Args:
             cls (Enum): subclass of NamedEnum class.
             field_name (str): attribute's name.
@@ -270,9 +1509,18 @@ class NamedEnumMeta(EnumMeta):
             Union[Tuple, Generator]: collection of enumeration items matching
             the condition.
         """
-        g = (item for item in cls.gen(name_value_pair=False)
-             if getattr(item.value, field_name) == field_value)
-        return tuple(g) if as_tuple else g
+        items = None
+        index = cls._field_index(field_name)
+        if index is not None:
+            try:
+                items = index.get(field_value, ())
+            except TypeError:
+                # unhashable field_value, fall back to the linear scan
+                pass
+        if items is None:
+            items = tuple(item for item in cls.gen(name_value_pair=False)
+                          if getattr(item.value, field_name) == field_value)
+        return items if as_tuple else (item for item in items)
 
     @classmethod
     def _has_field(mcs, cls: Enum, field_name: str, field_value: Any) -> bool:
@@ -282,7 +1530,10 @@ class NamedEnumMeta(EnumMeta):
 
         Note:
             It's used to generate the particular function with name format
-            `has_<field_name>` for each `field_name`.
+            `has_<field_name>` for each `field_name`. The membership is checked
+            against the set of the field's values. It falls back to compare
+            with the values one by one, if the values of the field or the given
+            `field_value` are unhashable.
 
         Args:
             cls (Enum): subclass of NamedEnum class.
@@ -292,8 +1543,129 @@ class NamedEnumMeta(EnumMeta):
         Returns:
             bool: True, if has at least one matching; otherwise False.
         """
-        gen_field_values = mcs._field_values(cls, field_name, as_tuple=False)
-        return field_value in gen_field_values
+        value_set = cls._field_value_set(field_name)
+        if value_set is not None:
+            try:
+                return field_value in value_set
+            except TypeError:
+                # unhashable field_value, fall back to the linear comparison
+                pass
+        return field_value in mcs._field_values(cls, field_name, as_tuple=True)
+
+    def from_fields(cls, **criteria: Any) -> Tuple:
+        """Returns a tuple of the enumeration items, whose fields have all the
+        given values.
+
+        Note:
+            If a field is named `fields`, the function `from_fields` of the
+            field takes precedence over it.
+
+            If a composite index declared by the variable `_indexes_` covers
+            some of the given fields, it's used for them. Otherwise the
+            shortest result of the hash indexes of the single fields is used.
+            The candidates are then filtered by the other given fields.
+
+        Args:
+            **criteria (Any): the names of the fields and their values.
+
+        Returns:
+            Tuple: the enumeration items matching all the criteria in the
+            definition order. Without criteria all the enumeration items are
+            returned.
+
+        Raises:
+            ValueError: if any of the given names isn't a field of the
+             enumeration.
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            ...     _indexes_ = [("first", "second")]
+            >>> class Triangle(TripleEnum):
+            ...     EQUILATERAL = (6, 6, 6)
+            ...     RIGHT = (3, 4, 5)
+            ...     ISOSCELES = (6, 6, 5)
+            >>> Triangle.from_fields(first=6, second=6)
+            (<Triangle.EQUILATERAL: NamedTuple(first=6, second=6, third=6)>, <Triangle.ISOSCELES: NamedTuple(first=6, second=6, third=5)>)
+            >>> Triangle.from_fields(first=6, third=5)
+            (<Triangle.ISOSCELES: NamedTuple(first=6, second=6, third=5)>,)
+        """
+        fields = cls._fields()
+        for field_name in criteria:
+            if field_name not in fields:
+                raise ValueError("%r is not a field of %s." % (field_name, cls.__name__))
+        candidates = None
+        covered: Tuple[str, ...] = ()
+        try:
+            # the composite index covering the most given fields
+            for index_fields in cls._composite_indexes():
+                if len(index_fields) > len(covered) and \
+                        all(field_name in criteria for field_name in index_fields):
+                    index = cls._composite_index(index_fields)
+                    if index is not None:
+                        covered = index_fields
+                        candidates = index.get(
+                            tuple(criteria[field_name] for field_name in index_fields), ())
+            if candidates is None:
+                # the shortest result of the indexes of the single fields
+                for field_name, field_value in criteria.items():
+                    index = cls._field_index(field_name)
+                    if index is None:
+                        continue
+                    items = index.get(field_value, ())
+                    if candidates is None or len(items) < len(candidates):
+                        candidates = items
+                        covered = (field_name, )
+        except TypeError:
+            # unhashable field value, fall back to the linear scan
+            candidates = None
+            covered = ()
+        if candidates is None:
+            candidates = tuple(cls.gen(name_value_pair=False))
+        remaining = [(fields.index(field_name), field_value)
+                     for field_name, field_value in criteria.items()
+                     if field_name not in covered]
+        if not remaining:
+            return candidates
+        return tuple(item for item in candidates
+                     if all(item._value_[i] == field_value for i, field_value in remaining))
+
+    def from_any(cls, value: Any) -> Tuple[Tuple[str, Enum], ...]:
+        """Returns the pairs of the field name and the enumeration item, whose
+        name or value of any field is the given value.
+
+        Note:
+            If a field is named `any`, the function `from_any` of the field
+            takes precedence over it.
+
+            The matches come from one inverted index of the names and all the
+            fields, which is built once. They are ordered by the priority: the
+            name of the enumeration item first with the field name `'name'`,
+            then the fields in the order of `_fields()`, each in the definition
+            order of the enumeration items.
+
+        Args:
+            value (Any): the name or the value of any field to find.
+
+        Returns:
+            Tuple[Tuple[str, Enum], ...]: the pairs of the field name and the
+            enumeration item, empty if nothing matches.
+
+        Examples:
+            >>> class PairEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second")
+            >>> class Pair(PairEnum):
+            ...     LEFT = ("left", "right")
+            ...     RIGHT = ("right", "left")
+            >>> Pair.from_any("LEFT")
+            (('name', <Pair.LEFT: NamedTuple(first='left', second='right')>),)
+            >>> Pair.from_any("right")
+            (('first', <Pair.RIGHT: NamedTuple(first='right', second='left')>), ('second', <Pair.LEFT: NamedTuple(first='left', second='right')>))
+        """
+        try:
+            return cls._any_index().get(value, ())
+        except TypeError:
+            return ()
 
     def gen(cls, name_value_pair: Optional[bool] = True) -> Generator:
         """Returns a generator of pairs consisting of each enumeration item's
@@ -336,24 +1708,85 @@ class NamedEnumMeta(EnumMeta):
             return ((name, item.value) for name, item in cls._member_map_.items())
         return (item for name, item in cls._member_map_.items())
 
-    def _as_data_type(cls, data_type: Union[dict, list, set, tuple, OrderedDict])\
-            -> Union[Dict, List, Set, Tuple, OrderedDict]:
-        """ase function converts the enumeration class to the given data type
+    def _as_data_type(cls, data_type: Union[dict, list, set, frozenset, tuple, OrderedDict])\
+            -> Union[Dict, List, Set, FrozenSet, Tuple, OrderedDict]:
+        """Base function converts the enumeration class to the given data type
         value.
 
         Note:
             It's used for generating the functions like `as_dict`, `as_tuple`,
-            `as_set`, `as_list`, `as_ordereddict`.
+            `as_set`, `as_list`, `as_ordereddict`. The name-value pairs are
+            collected once, so the functions only pay for creating the
+            container. Since a `tuple` is immutable, the cached pairs are
+            returned directly for it.
 
         Args:
-            data_type (Union[dict, list, set, tuple, OrderedDict]): desired data
-             type for the output.
+            data_type (Union[dict, list, set, frozenset, tuple, OrderedDict]):
+             desired data type for the output.
 
         Returns:
-            Union[Dict, List, Set, Tuple, OrderedDict]: converted value
+            Union[Dict, List, Set, FrozenSet, Tuple, OrderedDict]: converted value
             depending on the given data type.
         """
-        return data_type(cls.gen(name_value_pair=True))
+        items = cls._cached('items', lambda: tuple(cls.gen(name_value_pair=True)))
+        if data_type is tuple:
+            return items
+        return data_type(items)
+
+    def as_mapping(cls) -> Mapping:
+        """Returns a read-only view of the enumeration as a `mapping`, in which
+        the key is the name of the enumeration item and value is its value.
+
+        Note:
+            The view is built once and the same object is returned for the
+            following calls. Uses `as_dict` to get a mutable copy.
+
+        Returns:
+            Mapping: a read-only mapping containing name-value-pairs of the
+            enumeration.
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            >>> class Triangle(TripleEnum):
+            ...     EQUILATERAL = (6, 6, 6)
+            ...     RIGHT = (3, 4, 5)
+            >>> TripleEnum.as_mapping()
+            mappingproxy({})
+            >>> Triangle.as_mapping()
+            mappingproxy({'EQUILATERAL': NamedTuple(first=6, second=6, third=6), 'RIGHT': NamedTuple(first=3, second=4, third=5)})
+            >>> Triangle.as_mapping() is Triangle.as_mapping()
+            True
+        """
+        return cls._cached('mapping',
+                           lambda: MappingProxyType(cls._as_data_type(dict)))
+
+    def as_frozenset(cls) -> FrozenSet:
+        """Returns the enumeration as a `frozenset`, in which each item is a
+        tuple of the enumeration item's name and value.
+
+        Note:
+            The `frozenset` is built once and the same object is returned for
+            the following calls. Uses `as_set` to get a mutable copy.
+
+        Returns:
+            FrozenSet: a frozenset containing name-value-pairs of the
+            enumeration.
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            >>> class Triangle(TripleEnum):
+            ...     EQUILATERAL = (6, 6, 6)
+            ...     RIGHT = (3, 4, 5)
+            >>> TripleEnum.as_frozenset()
+            frozenset()
+            >>> Triangle.as_frozenset() == frozenset(Triangle.as_set())
+            True
+            >>> Triangle.as_frozenset() is Triangle.as_frozenset()
+            True
+        """
+        return cls._cached('frozenset', lambda: cls._as_data_type(frozenset))
 
     def as_dict(cls) -> Dict:
         """Converts the enumeration to a `dict`, in which the key is the name
@@ -458,6 +1891,306 @@ class NamedEnumMeta(EnumMeta):
         """
         return cls._as_data_type(OrderedDict)
 
+    def to_numpy(cls, field_name: str) -> Any:
+        """Converts the values of the given field to a NumPy array, the dtype
+        is inferred from the values.
+
+        Note:
+            NumPy is an optional dependency and only imported when it's
+            called. The array is read-only, it's built once and the same
+            object is returned for the following calls.
+
+        Args:
+            field_name (str): name of the field.
+
+        Returns:
+            numpy.ndarray: a one-dimensional array of the field values in the
+            definition order of the enumeration items.
+
+        Raises:
+            ValueError: if the given field_name is not a field of the
+             enumeration.
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            >>> class Triangle(TripleEnum):
+            ...     EQUILATERAL = (6, 6, 6)
+            ...     RIGHT = (3, 4, 5)
+            >>> Triangle.to_numpy("third").tolist()
+            [6, 5]
+        """
+        if field_name not in cls._fields():
+            raise ValueError("%r is not a field of %s." % (field_name, cls.__name__))
+
+        def build() -> Any:
+            return _to_array(_import_numpy(),
+                             type(cls)._field_values(cls, field_name, as_tuple=True))
+        return cls._cached(('numpy', field_name), build)
+
+    def to_structured_array(cls) -> Any:
+        """Converts the enumeration to a NumPy structured array, which has one
+        row per enumeration item, the column 'name' for its name and one
+        column for each field.
+
+        Note:
+            NumPy is an optional dependency and only imported when it's
+            called. The array is read-only, it's built once and the same
+            object is returned for the following calls.
+
+        Returns:
+            numpy.ndarray: a structured array of the enumeration items in the
+            definition order.
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            >>> class Triangle(TripleEnum):
+            ...     EQUILATERAL = (6, 6, 6)
+            ...     RIGHT = (3, 4, 5)
+            >>> Triangle.to_structured_array().tolist()
+            [('EQUILATERAL', 6, 6, 6), ('RIGHT', 3, 4, 5)]
+        """
+        def build() -> Any:
+            numpy = _import_numpy()
+            names = numpy.array(NamedEnumMeta.names(cls), dtype=str)
+            columns = [('name', names)]
+            columns.extend((field_name, cls.to_numpy(field_name))
+                           for field_name in cls._fields())
+            array = numpy.empty(len(columns[0][1]),
+                                dtype=[(name, column.dtype) for name, column in columns])
+            for name, column in columns:
+                array[name] = column
+            array.flags.writeable = False
+            return array
+        return cls._cached('structured_array', build)
+
+    def _ordinal_members(cls) -> Tuple:
+        """Returns the enumeration items without the aliases in the definition
+        order, such that the position of an item is its ordinal.
+
+        Returns:
+            Tuple: the enumeration items indexed by their ordinals.
+        """
+        return cls._cached(
+            'ordinal_members',
+            lambda: tuple(map(cls._member_map_.__getitem__, cls._member_names_)))
+
+    def from_ordinal(cls, ordinal: int) -> Enum:
+        """Returns the enumeration item with the given ordinal, i.e. its
+        position in the definition order without the aliases.
+
+        Note:
+            If a field is named `ordinal`, the function `from_ordinal` of the
+            field takes precedence over it.
+
+        Args:
+            ordinal (int): ordinal of the enumeration item.
+
+        Returns:
+            Enum: the enumeration item.
+
+        Raises:
+            ValueError: if the given ordinal is out of range.
+            TypeError: if the given ordinal is a boolean value.
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            >>> class Triangle(TripleEnum):
+            ...     EQUILATERAL = (6, 6, 6)
+            ...     RIGHT = (3, 4, 5)
+            >>> Triangle.RIGHT.ordinal
+            1
+            >>> Triangle.from_ordinal(1)
+            <Triangle.RIGHT: NamedTuple(first=3, second=4, third=5)>
+        """
+        # bool is a subclass of int, but True isn't the ordinal 1
+        if isinstance(ordinal, bool):
+            raise TypeError("The ordinal of %s must be an integer, not %r."
+                            % (cls.__name__, ordinal))
+        members = cls._ordinal_members()
+        try:
+            if ordinal >= 0:
+                return members[ordinal]
+        except (IndexError, TypeError):
+            pass
+        raise ValueError("%r is not a valid ordinal of %s." % (ordinal, cls.__name__))
+
+    def _ordinal_column(cls, field_name: str) -> Any:
+        """Returns the values of the given field indexed by the ordinals of
+        the enumeration items as a read-only NumPy array.
+
+        Args:
+            field_name (str): name of the field.
+
+        Returns:
+            numpy.ndarray: values of the field indexed by the ordinals.
+        """
+        def build() -> Any:
+            getter = itemgetter(cls._fields().index(field_name))
+            return _to_array(_import_numpy(),
+                             tuple(getter(item._value_)
+                                   for item in cls._ordinal_members()))
+        return cls._cached(('ordinal_column', field_name), build)
+
+    def _ordinal_lookup(cls, field_name: str) -> Tuple[Any, Any, Optional[Dict]]:
+        """Returns the precomputed lookup from the values of the given field to
+        the ordinals. If several enumeration items have the same value, the
+        smallest ordinal is used.
+
+        Args:
+            field_name (str): name of the field.
+
+        Returns:
+            Tuple[Any, Any, Optional[Dict]]: the values of the field sorted
+            stably, the ordinals in the same order, and a dictionary mapping
+            the values to the ordinals or None if any value is unhashable.
+        """
+        def build() -> Tuple[Any, Any, Optional[Dict]]:
+            column = cls._ordinal_column(field_name)
+            if column.dtype.kind == 'O':
+                sorter = sorted_column = None
+            else:
+                sorter = column.argsort(kind='stable')
+                sorted_column = column[sorter]
+            try:
+                lookup: Optional[Dict] = {}
+                for ordinal, value in enumerate(column.tolist()):
+                    lookup.setdefault(value, ordinal)
+            except TypeError:
+                lookup = None
+            return sorted_column, sorter, lookup
+        return cls._cached(('ordinal_lookup', field_name), build)
+
+    def encode(cls, field_name: str, values: Iterable,
+               fill_value: Optional[int] = None) -> Any:
+        """Converts the values of the given field to the ordinals of the
+        corresponding enumeration items, i.e. their positions in the
+        definition order without the aliases.
+
+        Note:
+            NumPy is an optional dependency and only imported when it's
+            called. The numeric and string values are looked up at once by
+            binary search in the sorted values of the field, the other values
+            are looked up one by one in a dictionary.
+
+        Args:
+            field_name (str): name of the field.
+            values (Iterable): values to convert, e.g. a NumPy array, an
+             `array.array` or a list.
+            fill_value (Optional[int]): ordinal of the values not belonging to
+             any enumeration item. Default value is None, which means raising
+             an error.
+
+        Returns:
+            numpy.ndarray: an integer array of the ordinals.
+
+        Raises:
+            ValueError: if the given field_name is not a field of the
+             enumeration, or a value doesn't belong to any enumeration item and
+             fill_value is None.
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            >>> class Triangle(TripleEnum):
+            ...     EQUILATERAL = (6, 6, 6)
+            ...     RIGHT = (3, 4, 5)
+            >>> Triangle.encode("third", [5, 6, 5]).tolist()
+            [1, 0, 1]
+            >>> Triangle.encode("third", [5, 7], fill_value=-1).tolist()
+            [1, -1]
+        """
+        if field_name not in cls._fields():
+            raise ValueError("%r is not a field of %s." % (field_name, cls.__name__))
+        numpy = _import_numpy()
+        sorted_column, sorter, lookup = cls._ordinal_lookup(field_name)
+        if not isinstance(values, numpy.ndarray):
+            values = _to_array(numpy, values if isinstance(values, (Sequence, _array))
+                               else list(values))
+        if _is_searchable(sorted_column, values):
+            positions = numpy.searchsorted(sorted_column, values)
+            positions[positions == sorted_column.size] = 0
+            ordinals = sorter[positions]
+            found = sorted_column[positions] == values
+        else:
+            if lookup is None:
+                column = cls._ordinal_column(field_name).tolist()
+                ordinals = numpy.fromiter(
+                    (column.index(value) if value in column else -1
+                     for value in values.tolist()),
+                    dtype=numpy.intp, count=values.size)
+            else:
+                get = lookup.get
+                ordinals = numpy.fromiter(
+                    (get(value, -1) for value in values.tolist()),
+                    dtype=numpy.intp, count=values.size)
+            found = ordinals >= 0
+        if not found.all():
+            if fill_value is None:
+                missing = values[~found].tolist()[0]
+                raise ValueError("%r is not a valid value of the field %r in %s."
+                                 % (missing, field_name, cls.__name__))
+            ordinals = numpy.where(found, ordinals, fill_value)
+        return ordinals.astype(numpy.intp, copy=False)
+
+    def decode(cls, ordinals: Iterable, field_name: Optional[str] = None) -> Any:
+        """Converts the ordinals to the enumeration items, or to the values of
+        the given field of the enumeration items.
+
+        Note:
+            NumPy is an optional dependency and only imported when it's
+            called. The result is taken from the cached columns at once.
+
+        Args:
+            ordinals (Iterable): ordinals of the enumeration items, e.g. the
+             result of `encode`.
+            field_name (Optional[str]): name of the field. Default value is
+             None, which means returning the enumeration items.
+
+        Returns:
+            numpy.ndarray: an array of the enumeration items or the values of
+            the field.
+
+        Raises:
+            ValueError: if the given field_name is not a field of the
+             enumeration, or an ordinal isn't an integer or is out of range.
+
+        Examples:
+            >>> class TripleEnum(NamedEnum):
+            ...     _field_names_ = ("first", "second", "third")
+            >>> class Triangle(TripleEnum):
+            ...     EQUILATERAL = (6, 6, 6)
+            ...     RIGHT = (3, 4, 5)
+            >>> Triangle.decode([1, 0, 1], "third").tolist()
+            [5, 6, 5]
+            >>> Triangle.decode([1]).tolist()
+            [<Triangle.RIGHT: NamedTuple(first=3, second=4, third=5)>]
+        """
+        if field_name is not None and field_name not in cls._fields():
+            raise ValueError("%r is not a field of %s." % (field_name, cls.__name__))
+        numpy = _import_numpy()
+        if field_name is None:
+            column = cls._cached(
+                ('ordinal_column', None),
+                lambda: _to_array(numpy, cls._ordinal_members()))
+        else:
+            column = cls._ordinal_column(field_name)
+        if not isinstance(ordinals, numpy.ndarray):
+            ordinals = numpy.asarray(ordinals if isinstance(ordinals, Sequence)
+                                     else list(ordinals))
+            if not ordinals.size:
+                ordinals = ordinals.astype(numpy.intp)
+        if not numpy.issubdtype(ordinals.dtype, numpy.integer):
+            raise ValueError("%r is not a valid ordinal of %s."
+                             % (ordinals.ravel().tolist()[0], cls.__name__))
+        invalid = (ordinals < 0) | (ordinals >= column.size)
+        if invalid.any():
+            raise ValueError("%r is not a valid ordinal of %s."
+                             % (ordinals[invalid].tolist()[0], cls.__name__))
+        return column.take(ordinals)
+
     def __repr__(cls) -> str:
         """Overrides the __repr__ function from EnumMeta class.
 
@@ -492,7 +2225,7 @@ class NamedEnumMeta(EnumMeta):
         max_lengths, headers = [], []
         fields = cls._fields() if cls._fields() else ("value",)
         row_format = ["{:>%d}"] * (len(fields) + 1)
-        names = [name] + list(cls.names())
+        names = [name] + list(NamedEnumMeta.names(cls))
         max_lengths.append(max(list(map(len, names))))
         headers.append(name.capitalize())
         for attr_name in fields:
@@ -545,8 +2278,8 @@ class NamedEnumMeta(EnumMeta):
             >>> list(Triangle.names(as_tuple=False))
             ['EQUILATERAL', 'RIGHT']
         """
-        g = (name for name in cls._member_map_.keys())
-        return tuple(g) if as_tuple else g
+        names = cls._cached('names', lambda: tuple(cls._member_map_.keys()))
+        return names if as_tuple else (name for name in names)
 
     def values(cls, as_tuple: Optional[bool] = True) -> Union[Tuple, Generator]:
         """Returns the values of all the enumeration items as a tuple, if
@@ -580,5 +2313,7 @@ class NamedEnumMeta(EnumMeta):
             >>> list(Triangle.values(as_tuple=False))
             [NamedTuple(first=6, second=6, third=6), NamedTuple(first=3, second=4, third=5)]
         """
-        g = (item.value for item in cls._member_map_.values())
-        return tuple(g) if as_tuple else g
+        values = cls._cached(
+            'values',
+            lambda: tuple(item.value for item in cls._member_map_.values()))
+        return values if as_tuple else (value for value in values)
@@ -0,0 +1,169 @@
+import copy
+import pickle
+import pytest
+from array import array
+from named_enum import EnumMap, EnumSet, LabeledEnum, ExtendedEnum
+
+
+class Color(LabeledEnum):
+    RED = ("red", "Red")
+    GREEN = ("green", "Green")
+    BLUE = ("blue", "Blue")
+    CRIMSON = ("red", "Red")
+
+
+class Shape(ExtendedEnum):
+    CIRCLE = 1
+    SQUARE = 2
+
+
+class TestEnumMap:
+    @pytest.fixture(autouse=True, params=[None, "l"])
+    def setup(self, request):
+        self.typecode = request.param
+        self.map = EnumMap(Color, {Color.BLUE: 3, Color.RED: 1}, typecode=self.typecode)
+
+    def test___init__(self):
+        assert self.map.enum_cls is Color
+        assert self.map.typecode == self.typecode
+        assert dict(EnumMap(Color, [(Color.GREEN, 2)], typecode=self.typecode)) == \
+            {Color.GREEN: 2}
+        assert len(EnumMap(Color, typecode=self.typecode)) == 0
+        assert len(self.map._values) == 3
+        if self.typecode is not None:
+            assert isinstance(self.map._values, array)
+            assert self.map._values.tolist() == [1, 0, 3]
+
+    @pytest.mark.parametrize("enum_cls, data, err_msg",
+                             [(int, None, "<class 'int'> is not a named enum class."),
+                              (Color, {Shape.CIRCLE: 1},
+                               "<Shape.CIRCLE: 1> is not an enumeration item of Color."),
+                              (Color, {"RED": 1}, "'RED' is not an enumeration item of Color.")])
+    def test___init___fail(self, enum_cls, data, err_msg):
+        with pytest.raises(TypeError) as excinfo:
+            EnumMap(enum_cls, data, typecode=self.typecode)
+        assert str(excinfo.value) == err_msg
+
+    def test___getitem__(self):
+        assert self.map[Color.RED] == 1
+        assert self.map[Color.CRIMSON] == 1
+        assert self.map[Color.BLUE] == 3
+        for key in (Color.GREEN, Shape.CIRCLE, "RED"):
+            with pytest.raises(KeyError):
+                self.map[key]
+
+    def test_get(self):
+        assert self.map.get(Color.BLUE) == 3
+        assert self.map.get(Color.GREEN) is None
+        assert self.map.get(Shape.CIRCLE, 0) == 0
+        assert self.map.get("RED", 0) == 0
+
+    def test___setitem__(self):
+        self.map[Color.GREEN] = 2
+        self.map[Color.RED] = 4
+        assert list(self.map.items()) == [(Color.RED, 4), (Color.GREEN, 2), (Color.BLUE, 3)]
+        with pytest.raises(TypeError, match="'GREEN' is not an enumeration item of Color."):
+            self.map["GREEN"] = 2
+
+    def test___delitem__(self):
+        del self.map[Color.RED]
+        assert dict(self.map) == {Color.BLUE: 3}
+        for key in (Color.RED, Shape.CIRCLE):
+            with pytest.raises(KeyError):
+                del self.map[key]
+        assert self.map.pop(Color.BLUE) == 3
+        assert len(self.map) == 0
+
+    def test___contains__(self):
+        assert Color.RED in self.map
+        assert Color.GREEN not in self.map
+        assert Shape.CIRCLE not in self.map
+        assert "RED" not in self.map
+
+    def test_iteration(self):
+        assert list(self.map) == [Color.RED, Color.BLUE]
+        assert list(self.map.values()) == [1, 3]
+        assert len(self.map) == 2
+        assert self.map.key_set() == EnumSet(Color, [Color.RED, Color.BLUE])
+
+    def test_clear_copy(self):
+        result = self.map.copy()
+        assert result == self.map
+        assert result.typecode == self.typecode
+        result.clear()
+        assert len(result) == 0
+        assert result.get(Color.RED) is None
+        assert dict(self.map) == {Color.RED: 1, Color.BLUE: 3}
+
+    def test___eq__(self):
+        assert self.map == {Color.RED: 1, Color.BLUE: 3}
+        assert self.map == EnumMap(Color, {Color.BLUE: 3, Color.RED: 1})
+        assert self.map == EnumMap(Color, {Color.BLUE: 3, Color.RED: 1}, typecode="d")
+        assert self.map != EnumMap(Color, {Color.BLUE: 3, Color.RED: 2})
+        assert self.map != EnumMap(Color, {Color.BLUE: 3})
+        assert self.map != [(Color.RED, 1), (Color.BLUE, 3)]
+        with pytest.raises(TypeError):
+            hash(self.map)
+
+    def test___repr__(self):
+        if self.typecode is None:
+            assert repr(self.map) == "EnumMap(Color, {Color.RED: 1, Color.BLUE: 3})"
+        else:
+            assert repr(self.map) == "EnumMap(Color, {Color.RED: 1, Color.BLUE: 3}, typecode='l')"
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        result = pickle.loads(pickle.dumps(self.map, protocol))
+        assert result == self.map
+        assert result.typecode == self.typecode
+        assert type(result._values) is type(self.map._values)
+
+    @pytest.mark.parametrize("copy_func", [copy.copy, copy.deepcopy, EnumMap.copy])
+    def test_copy_storage(self, copy_func):
+        result = copy_func(self.map)
+        assert result == self.map
+        assert result._values is not self.map._values
+        result[Color.RED] = 99
+        assert self.map[Color.RED] == 1
+
+    def test__from_state_copy(self):
+        values = [1, 3] if self.typecode is None else array(self.typecode, [1, 0, 3])
+        result = EnumMap._from_state(Color, self.typecode, 0b101, values)
+        assert result._values is not values
+        result[Color.RED] = 99
+        assert values[0] == 1
+
+    def test__from_state_fail(self):
+        values = [1] if self.typecode is None else array(self.typecode, [1])
+        with pytest.raises(ValueError, match="The values don't match the items of Color."):
+            EnumMap._from_state(Color, self.typecode, 0b101, values)
+        with pytest.raises(ValueError, match="8 is not a valid bit mask of Color."):
+            EnumMap._from_state(Color, self.typecode, 0b1000, values)
+        if self.typecode is not None:
+            for values in ([1, 0, 3], array("d", [1, 0, 3])):
+                with pytest.raises(ValueError, match="The values don't match the type code 'l'."):
+                    EnumMap._from_state(Color, self.typecode, 0b101, values)
+
+
+def test_array_values():
+    result = EnumMap(Color, typecode="d")
+    result[Color.GREEN] = 1.5
+    assert result[Color.GREEN] == 1.5
+    with pytest.raises(TypeError):
+        result[Color.RED] = "red"
+    del result[Color.GREEN]
+    assert result == EnumMap(Color, typecode="d")
+    assert result._values == EnumMap(Color, typecode="d")._values
+    with pytest.raises(ValueError):
+        EnumMap(Color, typecode="x")
+
+
+def test_unicode_array_values():
+    result = EnumMap(Color, {Color.RED: "r", Color.BLUE: "b"}, typecode="u")
+    del result[Color.RED]
+    assert dict(result) == {Color.BLUE: "b"}
+    assert result._values == EnumMap(Color, {Color.BLUE: "b"}, typecode="u")._values
+    assert result.pop(Color.BLUE) == "b"
+    assert len(result) == 0
+    result[Color.RED] = "x"
+    assert result == EnumMap(Color, {Color.RED: "x"}, typecode="u")
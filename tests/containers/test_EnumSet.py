@@ -0,0 +1,167 @@
+import pickle
+import pytest
+from named_enum import EnumSet, LabeledEnum, ExtendedEnum
+
+
+class Color(LabeledEnum):
+    RED = ("red", "Red")
+    GREEN = ("green", "Green")
+    BLUE = ("blue", "Blue")
+    CRIMSON = ("red", "Red")
+
+
+class Shape(ExtendedEnum):
+    CIRCLE = 1
+    SQUARE = 2
+
+
+class TestEnumSet:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.warm = EnumSet(Color, [Color.RED])
+        self.cold = EnumSet(Color, (Color.GREEN, Color.BLUE))
+        self.all = EnumSet(Color, Color)
+
+    def test___init__(self):
+        assert EnumSet(Color).bits == 0
+        assert self.cold.bits == 0b110
+        assert self.all.bits == 0b111
+        assert self.all.enum_cls is Color
+        assert EnumSet(Color, Color.from_key("red")).bits == 0b1
+        assert EnumSet(Color, self.cold).bits == 0b110
+
+    @pytest.mark.parametrize("enum_cls, members, err_msg",
+                             [(int, None, "<class 'int'> is not a named enum class."),
+                              (Color, [Shape.CIRCLE],
+                               "<Shape.CIRCLE: 1> is not an enumeration item of Color."),
+                              (Color, ["RED"], "'RED' is not an enumeration item of Color.")])
+    def test___init___fail(self, enum_cls, members, err_msg):
+        with pytest.raises(TypeError) as excinfo:
+            EnumSet(enum_cls, members)
+        assert str(excinfo.value) == err_msg
+
+    def test_from_bits(self):
+        result = EnumSet.from_bits(Color, 0b101)
+        assert list(result) == [Color.RED, Color.BLUE]
+        for bits in (-1, 0b1000):
+            with pytest.raises(ValueError, match="%r is not a valid bit mask of Color." % bits):
+                EnumSet.from_bits(Color, bits)
+
+    def test_iteration(self):
+        assert list(EnumSet(Color, [Color.BLUE, Color.RED, Color.CRIMSON])) == \
+            [Color.RED, Color.BLUE]
+        assert list(self.all) == list(Color)
+        assert len(self.all) == 3
+        assert len(EnumSet(Color)) == 0
+        assert not EnumSet(Color)
+        assert self.warm
+
+    def test___contains__(self):
+        assert Color.RED in self.warm
+        assert Color.CRIMSON in self.warm
+        assert Color.GREEN not in self.warm
+        assert Shape.CIRCLE not in self.warm
+        assert "RED" not in self.warm
+
+    def test___repr__(self):
+        assert repr(self.cold) == "EnumSet(Color, [Color.GREEN, Color.BLUE])"
+        assert repr(EnumSet(Shape)) == "EnumSet(Shape, [])"
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        result = pickle.loads(pickle.dumps(self.cold, protocol))
+        assert result == self.cold
+        assert result.enum_cls is Color
+        assert result.bits == self.cold.bits
+
+    def test_comparison(self):
+        assert self.warm == EnumSet(Color, [Color.CRIMSON])
+        assert self.warm != self.cold
+        assert self.warm == {Color.RED}
+        assert self.warm != {Color.RED, 1}
+        assert EnumSet(Color, [Color.RED]) != EnumSet(Shape, [Shape.CIRCLE])
+        # like the other sets, empty sets are equal
+        assert EnumSet(Color) == EnumSet(Shape)
+        assert self.warm <= self.all
+        assert self.warm < self.all
+        assert not self.all < self.all
+        assert self.all >= self.cold
+        assert self.all > self.cold
+        assert not self.cold > self.cold
+        assert self.warm <= {Color.RED, 1}
+        assert self.warm < {Color.RED, 1}
+        assert not self.warm >= {Color.RED, 1}
+        assert not self.warm > {Color.RED, 1}
+        with pytest.raises(TypeError):
+            hash(self.warm)
+
+    def test_algebra(self):
+        assert (self.warm | self.cold) == self.all
+        assert (self.all & self.cold) == self.cold
+        assert (self.all - self.cold) == self.warm
+        assert (self.warm ^ self.all) == self.cold
+        assert isinstance(self.warm | self.cold, EnumSet)
+        # with the other sets
+        assert (self.all & {Color.RED, 1}) == self.warm
+        assert ({Color.RED, 1} & self.all) == self.warm
+        assert (self.all - {Color.RED, 1}) == self.cold
+        assert (self.warm | {Color.GREEN, Color.BLUE}) == self.all
+        assert ({Color.GREEN, Color.BLUE} | self.warm) == self.all
+        assert (self.warm ^ {Color.RED, Color.GREEN}) == {Color.GREEN}
+        assert ({Color.RED, Color.GREEN} ^ self.warm) == {Color.GREEN}
+        with pytest.raises(TypeError):
+            self.warm | {1}
+
+    def test_inplace_algebra(self):
+        result = EnumSet(Color)
+        result |= [Color.RED, Color.BLUE]
+        assert result == {Color.RED, Color.BLUE}
+        result &= [Color.BLUE, Shape.CIRCLE]
+        assert result == {Color.BLUE}
+        result ^= self.all
+        assert result == {Color.RED, Color.GREEN}
+        result -= [Color.RED, 1]
+        assert result == {Color.GREEN}
+
+    def test_mutation(self):
+        result = EnumSet(Color)
+        result.add(Color.GREEN)
+        result.add(Color.RED)
+        assert result.bits == 0b11
+        result.discard(Color.RED)
+        result.discard(Color.RED)
+        result.discard(Shape.CIRCLE)
+        assert result.bits == 0b10
+        result.remove(Color.GREEN)
+        with pytest.raises(KeyError):
+            result.remove(Color.GREEN)
+        result.add(Color.BLUE)
+        assert result.pop() is Color.BLUE
+        result.update([Color.GREEN], EnumSet(Color, [Color.RED]))
+        assert result.bits == 0b11
+        result.clear()
+        assert result.bits == 0
+        with pytest.raises(TypeError):
+            result.add(Shape.CIRCLE)
+
+    def test_copy(self):
+        result = self.cold.copy()
+        assert result == self.cold
+        result.clear()
+        assert self.cold.bits == 0b110
+
+    def test_methods(self):
+        assert self.warm.union(self.cold) == self.all
+        assert self.warm.union([Color.GREEN], (Color.BLUE, )) == self.all
+        assert self.all.intersection(self.cold, [Color.BLUE, 1]) == {Color.BLUE}
+        assert self.all.difference(self.cold, [1]) == self.warm
+        assert self.warm.symmetric_difference([Color.RED, Color.BLUE]) == {Color.BLUE}
+        assert self.warm.isdisjoint(self.cold)
+        assert not self.warm.isdisjoint([Color.RED, 1])
+        assert self.warm.issubset(self.all)
+        assert self.warm.issubset([Color.RED, 1])
+        assert not self.all.issubset(self.cold)
+        assert self.all.issuperset(self.cold)
+        assert self.all.issuperset([Color.RED])
+        assert not self.all.issuperset([Color.RED, 1])
+        assert not self.warm.issuperset(self.cold)
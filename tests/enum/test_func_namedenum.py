@@ -1,4 +1,5 @@
 import sys as _sys
+import pytest
 from unittest import mock
 from named_enum import namedenum
 from collections import OrderedDict
@@ -148,3 +149,87 @@ class TestNamedEnumFunc(CommonEnumTest, ExtraEnumTest):
                                    ("first", "second", "third"), module=None)
         assert TripleFakeEnum.__module__ == 'TripleFakeEnum'
         mocked__getframe.assert_called_with(1)
+
+    def test_verbose(self, capsys):
+        PairFakeEnum = namedenum("PairFakeEnum", ("first", "second"), verbose=True)
+        assert capsys.readouterr().out == ("from named_enum import NamedEnum\n\n\n"
+                                           "class PairFakeEnum(NamedEnum):\n\n"
+                                           "    _field_names_ = ('first', 'second')\n\n\n")
+        assert PairFakeEnum._fields() == ("first", "second")
+        assert PairFakeEnum.__qualname__ == "PairFakeEnum"
+        assert PairFakeEnum.__module__ == __name__
+        assert "_source" not in PairFakeEnum.__dict__
+
+
+class TestNamedEnumCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        namedenum.cache_clear()
+        yield
+        namedenum.cache_resize(128)
+        namedenum.cache_clear()
+
+    def test_cache(self):
+        FirstEnum = namedenum("CachedEnum", "first, second", cache=True)
+        assert namedenum.cache_info() == (0, 1, 128, 1)
+        assert namedenum("CachedEnum", ("first", "second"), cache=True) is FirstEnum
+        assert namedenum("CachedEnum", ["first", "second"], cache=True) is FirstEnum
+        assert namedenum.cache_info() == (2, 1, 128, 1)
+        assert FirstEnum.__module__ == __name__
+        # different typename, field names or module create new classes
+        assert namedenum("OtherEnum", "first, second", cache=True) is not FirstEnum
+        assert namedenum("CachedEnum", "first", cache=True) is not FirstEnum
+        assert namedenum("CachedEnum", "first, second", module="dummy",
+                         cache=True) is not FirstEnum
+        # without cache a new class is always created
+        assert namedenum("CachedEnum", "first, second") is not FirstEnum
+        assert namedenum.cache_info() == (2, 4, 128, 4)
+
+    def test_cache_lru(self):
+        namedenum.cache_resize(2)
+        FirstEnum = namedenum("FirstEnum", "first", cache=True)
+        SecondEnum = namedenum("SecondEnum", "second", cache=True)
+        assert namedenum("FirstEnum", "first", cache=True) is FirstEnum
+        # the least recently used class SecondEnum is evicted
+        namedenum("ThirdEnum", "third", cache=True)
+        assert namedenum.cache_info() == (1, 3, 2, 2)
+        assert namedenum("FirstEnum", "first", cache=True) is FirstEnum
+        assert namedenum("SecondEnum", "second", cache=True) is not SecondEnum
+
+    def test_cache_resize(self):
+        FirstEnum = namedenum("FirstEnum", "first", cache=True)
+        namedenum("SecondEnum", "second", cache=True)
+        assert namedenum("FirstEnum", "first", cache=True) is FirstEnum
+        # the least recently used classes exceeding the new size are evicted
+        namedenum.cache_resize(1)
+        assert namedenum.cache_info() == (1, 2, 1, 1)
+        assert namedenum("FirstEnum", "first", cache=True) is FirstEnum
+        namedenum.cache_resize(0)
+        assert namedenum.cache_info() == (2, 2, 0, 0)
+        assert namedenum("FirstEnum", "first", cache=True) is not FirstEnum
+        assert namedenum.cache_info().currsize == 0
+
+    @pytest.mark.parametrize("maxsize", [-1, 1.5, None, True])
+    def test_cache_resize_fail(self, maxsize):
+        with pytest.raises(ValueError, match="is not a valid size of the cache."):
+            namedenum.cache_resize(maxsize)
+        assert namedenum.cache_info().maxsize == 128
+
+    def test_cache_verbose(self, capsys):
+        FirstEnum = namedenum("CachedEnum", "first", cache=True)
+        assert capsys.readouterr().out == ""
+        assert namedenum("CachedEnum", "first", verbose=True, cache=True) is FirstEnum
+        assert "class CachedEnum(NamedEnum):" in capsys.readouterr().out
+
+    def test_cache_clear(self):
+        FirstEnum = namedenum("CachedEnum", None, cache=True)
+        assert namedenum("CachedEnum", None, cache=True) is FirstEnum
+        namedenum.cache_clear()
+        assert namedenum.cache_info() == (0, 0, 128, 0)
+        assert namedenum("CachedEnum", None, cache=True) is not FirstEnum
+
+    @mock.patch.object(_sys, '_getframe', side_effect=AttributeError)
+    def test_cache_error(self, mocked__getframe):
+        FirstEnum = namedenum("CachedEnum", "first", cache=True)
+        assert FirstEnum.__module__ == "CachedEnum"
+        assert namedenum("CachedEnum", "first", cache=True) is FirstEnum
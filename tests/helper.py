@@ -1,3 +1,4 @@
+import inspect
 import types
 import pytest
 from unittest import mock
@@ -38,10 +39,70 @@ class CommonEnumTest:
         generator_tester(result, expected_result)
 
     def test__as_data_type(self, data_type, expected):
-        with spy(self.enum_cls, 'gen') as mocked_gen:
+        with spy(self.enum_cls, '_cached') as mocked__cached:
             result = self.enum_cls._as_data_type(data_type)
             assert result == expected
-            mocked_gen.assert_called_once_with(name_value_pair=True)
+            assert type(result) is data_type
+            mocked__cached.assert_called_once_with('items', mock.ANY)
+
+    def test_as_mapping(self):
+        result = self.enum_cls.as_mapping()
+        assert isinstance(result, types.MappingProxyType)
+        assert result == self.enum_cls.as_dict()
+        assert result is self.enum_cls.as_mapping()
+        with pytest.raises(TypeError):
+            result["DUMMY"] = None
+
+    def test_as_frozenset(self):
+        result = self.enum_cls.as_frozenset()
+        assert isinstance(result, frozenset)
+        assert result == self.enum_cls.as_set()
+        assert result is self.enum_cls.as_frozenset()
+
+    def test_ordinal(self):
+        members = tuple(self.enum_cls)
+        assert self.enum_cls._ordinal_members() == members
+        assert self.enum_cls._ordinal_members() is self.enum_cls._ordinal_members()
+        for ordinal, member in enumerate(members):
+            assert member._ordinal_ == ordinal
+            assert self.enum_cls.from_ordinal(ordinal) is member
+            if "ordinal" not in self.enum_cls._fields():
+                assert member.ordinal == ordinal
+        for ordinal in (-1, len(members), "0", None):
+            with pytest.raises(ValueError,
+                               match="is not a valid ordinal of %s." % self.enum_cls.__name__):
+                self.enum_cls.from_ordinal(ordinal)
+        for ordinal in (True, False):
+            with pytest.raises(TypeError,
+                               match="The ordinal of %s must be an integer, not %r."
+                                     % (self.enum_cls.__name__, ordinal)):
+                self.enum_cls.from_ordinal(ordinal)
+
+    def test_from_any(self):
+        fields = self.enum_cls._fields()
+        for name, member in self.enum_cls._member_map_.items():
+            assert ("name", member) in self.enum_cls.from_any(name)
+            for field_name in fields:
+                pairs = self.enum_cls.from_any(getattr(member, field_name))
+                assert (field_name, member) in pairs
+                field_names = ["name"] + list(fields)
+                assert [field_names.index(pair[0]) for pair in pairs] == \
+                    sorted(field_names.index(pair[0]) for pair in pairs)
+        assert self.enum_cls.from_any(object()) == ()
+        assert self.enum_cls._any_index() is self.enum_cls._any_index()
+
+    def test_to_structured_array(self):
+        np = pytest.importorskip("numpy")
+        result = self.enum_cls.to_structured_array()
+        assert isinstance(result, np.ndarray)
+        assert result.dtype.names == ("name", ) + self.enum_cls._fields()
+        fields = self.enum_cls._fields()
+        assert result.tolist() == [
+            (name, ) + tuple(getattr(value, field_name) for field_name in fields)
+            for name, value in self.enum_cls.gen()]
+        assert result is self.enum_cls.to_structured_array()
+        with pytest.raises(ValueError):
+            result["name"] = ""
 
     def test_as_x(self, func_name, expected):
         with spy(self.enum_cls, '_as_data_type') as mocked__as_data_type:
@@ -71,6 +132,7 @@ class CommonEnumTest:
         result = getattr(self.enum_cls, func_name)(as_tuple)
         if as_tuple:
             assert result == expected_result
+            assert result is getattr(self.enum_cls, func_name)(as_tuple)
         else:
             generator_tester(result, expected_result)
 
@@ -79,36 +141,193 @@ class ExtraEnumTest:
     enum_cls = None
 
     def test__field_values(self, func_name, as_tuple, expected):
-        with spy(self.enum_cls, 'gen') as mocked_gen:
-            result = getattr(self.enum_cls, func_name)(as_tuple)
-            if as_tuple:
-                assert result == expected
-            else:
-                generator_tester(result, expected)
-            mocked_gen.assert_called_once_with(name_value_pair=False)
+        result = getattr(self.enum_cls, func_name)(as_tuple)
+        if as_tuple:
+            assert result == expected
+            assert result is type(self.enum_cls)._field_values(
+                self.enum_cls, func_name[:-1], as_tuple)
+        else:
+            generator_tester(result, expected)
 
     def test__from_field(self, func_name, value, as_tuple, expected):
-        with spy(self.enum_cls, 'gen') as mocked_gen:
-            result = getattr(self.enum_cls, func_name)(value, as_tuple)
-            if as_tuple:
-                assert result == expected
-            else:
-                generator_tester(result, expected)
-            mocked_gen.assert_called_once_with(name_value_pair=False)
+        result = getattr(self.enum_cls, func_name)(value, as_tuple)
+        if as_tuple:
+            assert result == expected
+            assert result == type(self.enum_cls)._from_field(
+                self.enum_cls, func_name[5:], value, as_tuple)
+        else:
+            generator_tester(result, expected)
 
     def test__has_field(self, func_name, value, expected):
-        with spy(self.enum_cls, 'gen') as mocked_gen:
-            result = getattr(self.enum_cls, func_name)(value)
-            assert result == expected
-            mocked_gen.assert_called_once_with(name_value_pair=False)
+        result = getattr(self.enum_cls, func_name)(value)
+        assert result == expected
+        assert result == type(self.enum_cls)._has_field(
+            self.enum_cls, func_name[4:], value)
+
+    def test_from_field_many(self):
+        for field_name in self.enum_cls._fields():
+            values = getattr(self.enum_cls, "%ss" % field_name)()
+            from_field = getattr(self.enum_cls, "from_%s" % field_name)
+            from_field_many = getattr(self.enum_cls, "from_%s_many" % field_name)
+            expected = tuple(from_field(value) for value in values)
+            assert from_field_many(iter(values)) == expected
+            assert from_field_many(values + ("missing", ), missing="skip") == expected
+            assert from_field_many(("missing", ) + values, missing="none") == \
+                (None, ) + expected
+            with pytest.raises(ValueError,
+                               match="'missing' is not a valid value of the "
+                                     "field '%s'" % field_name):
+                from_field_many(values + ("missing", ))
+            with pytest.raises(ValueError, match="'missing' must be one of"):
+                from_field_many(values, missing="ignore")
+
+    def test_has_field_many(self):
+        for field_name in self.enum_cls._fields():
+            values = getattr(self.enum_cls, "%ss" % field_name)()
+            has_field_many = getattr(self.enum_cls, "has_%s_many" % field_name)
+            assert has_field_many(iter(values + ("missing", ))) == \
+                (True, ) * len(values) + (False, )
+            assert has_field_many([]) == ()
+
+    def test_to_numpy(self):
+        np = pytest.importorskip("numpy")
+        for field_name in self.enum_cls._fields():
+            result = self.enum_cls.to_numpy(field_name)
+            assert isinstance(result, np.ndarray)
+            assert result.shape == (len(self.enum_cls), )
+            assert tuple(result.tolist()) == getattr(self.enum_cls, "%ss" % field_name)()
+            assert result is self.enum_cls.to_numpy(field_name)
+            assert not result.flags.writeable
+        with pytest.raises(ValueError, match="'missing' is not a field of %s."
+                                             % self.enum_cls.__name__):
+            self.enum_cls.to_numpy("missing")
+
+    def test_encode_decode(self):
+        np = pytest.importorskip("numpy")
+        members = tuple(self.enum_cls)
+        assert self.enum_cls.decode(range(len(members))).tolist() == list(members)
+        for field_name in self.enum_cls._fields():
+            values = [getattr(member, field_name) for member in members]
+            ordinals = self.enum_cls.encode(field_name, values)
+            assert ordinals.dtype == np.intp
+            assert ordinals.tolist() == [values.index(value) for value in values]
+            assert self.enum_cls.decode(ordinals, field_name).tolist() == values
+            assert self.enum_cls.encode(field_name, values[::-1]).tolist() == \
+                ordinals.tolist()[::-1]
+
+    def test_from_fields(self):
+        fields = self.enum_cls._fields()
+        members = tuple(self.enum_cls.gen(name_value_pair=False))
+        assert self.enum_cls.from_fields() == members
+        for member in members:
+            criteria = {field_name: getattr(member, field_name) for field_name in fields}
+            assert self.enum_cls.from_fields(**criteria) == tuple(
+                item for item in members
+                if all(getattr(item, field_name) == field_value
+                       for field_name, field_value in criteria.items()))
+            for field_name, field_value in criteria.items():
+                from_field = getattr(self.enum_cls, "from_%s" % field_name)
+                assert self.enum_cls.from_fields(**{field_name: field_value}) == \
+                    from_field(field_value)
+        if fields:
+            assert self.enum_cls.from_fields(**{fields[0]: "missing"}) == ()
+        with pytest.raises(ValueError, match="'missing' is not a field of %s."
+                                             % self.enum_cls.__name__):
+            self.enum_cls.from_fields(missing=1)
+
+    def test_field_range(self):
+        members = tuple(self.enum_cls.gen(name_value_pair=False))
+        for field_name in self.enum_cls._fields():
+            def value_of(member):
+                return getattr(member, field_name)
+            ordered = tuple(sorted(members, key=value_of))
+            values = sorted(set(map(value_of, members)))
+            for value in values:
+                assert getattr(self.enum_cls, "%s_lt" % field_name)(value) == \
+                    tuple(item for item in ordered if value_of(item) < value)
+                assert getattr(self.enum_cls, "%s_le" % field_name)(value) == \
+                    tuple(item for item in ordered if value_of(item) <= value)
+                assert getattr(self.enum_cls, "%s_gt" % field_name)(value) == \
+                    tuple(item for item in ordered if value_of(item) > value)
+                assert getattr(self.enum_cls, "%s_ge" % field_name)(value) == \
+                    tuple(item for item in ordered if value_of(item) >= value)
+                assert getattr(self.enum_cls, "%s_between" % field_name)(value, values[-1]) == \
+                    tuple(item for item in ordered if value <= value_of(item))
+                assert getattr(self.enum_cls, "%s_between" % field_name)(values[-1], value) == \
+                    (() if value < values[-1] else
+                     getattr(self.enum_cls, "from_%s" % field_name)(value))
+                assert getattr(self.enum_cls, "%s_nearest" % field_name)(value) == \
+                    getattr(self.enum_cls, "from_%s" % field_name)(value)
+
+    def test_field_startswith(self):
+        members = tuple(self.enum_cls.gen(name_value_pair=False))
+        for field_name in self.enum_cls._fields():
+            values = [getattr(member, field_name) for member in members]
+            if not all(isinstance(value, str) for value in values):
+                continue
+            startswith = getattr(self.enum_cls, "%s_startswith" % field_name)
+            ordered = sorted(members, key=lambda member: getattr(member, field_name))
+            for value in values:
+                for prefix in (value, value[:1], value[:-1], value + "~"):
+                    expected = tuple(item for item in ordered
+                                     if getattr(item, field_name).startswith(prefix))
+                    assert startswith(prefix) == expected
+                    assert startswith(prefix, limit=1) == expected[:1]
+
+    def test_fuzzy_field(self):
+        members = tuple(self.enum_cls.gen(name_value_pair=False))
+        for field_name in self.enum_cls._fields():
+            values = [getattr(member, field_name) for member in members]
+            if not all(isinstance(value, str) for value in values):
+                continue
+            fuzzy = getattr(self.enum_cls, "fuzzy_%s" % field_name)
+            for value in values:
+                if not value.strip():
+                    continue
+                expected = tuple(member for member in members
+                                 if getattr(member, field_name).casefold() == value.casefold())
+                assert fuzzy(value, limit=None)[:len(expected)] == expected
+                assert fuzzy(value.upper(), limit=1) == expected[:1]
+
+    def test_field_func_signature(self):
+        for field_name in self.enum_cls._fields():
+            for func_name, params in [("%ss", ["as_tuple"]),
+                                      ("from_%s", ["field_value", "as_tuple"]),
+                                      ("has_%s", ["field_value"]),
+                                      ("from_%s_many", ["field_values", "missing"]),
+                                      ("has_%s_many", ["field_values"]),
+                                      ("%s_lt", ["field_value"]),
+                                      ("%s_le", ["field_value"]),
+                                      ("%s_gt", ["field_value"]),
+                                      ("%s_ge", ["field_value"]),
+                                      ("%s_between", ["low", "high"]),
+                                      ("%s_nearest", ["field_value"]),
+                                      ("%s_startswith", ["prefix", "limit"]),
+                                      ("fuzzy_%s", ["text", "limit", "min_score"])]:
+                func = getattr(self.enum_cls, func_name % field_name)
+                assert isinstance(func, types.FunctionType)
+                assert func.__name__ == func_name % field_name
+                assert func.__qualname__ == "%s.%s" % (
+                    self.enum_cls.__qualname__, func_name % field_name)
+                assert list(inspect.signature(func).parameters) == params
 
     def test__func_fail(self, func_name, func_param, error_type):
         with pytest.raises(error_type, match=func_name):
             getattr(self.enum_cls, func_name)(*func_param)
 
+    def test_field_property(self):
+        with spy(self.enum_cls, '__getattr__') as mocked___getattr__:
+            for member in self.enum_cls:
+                for field_name in self.enum_cls._fields():
+                    assert getattr(member, field_name) == \
+                        getattr(member.value, field_name)
+            mocked___getattr__.assert_not_called()
+
     def test___getattr___success(self, obj, func_name, expected):
         result = getattr(obj, func_name)
         assert result == expected
+        # calls the fallback directly, which is skipped by the field properties
+        assert obj.__getattr__(func_name) == expected
 
     def test___getattr___fail(self, obj, func_name, err_msg):
         with pytest.raises(AttributeError, match=err_msg):
@@ -1,8 +1,15 @@
+import sys as _sys
+import array
+import inspect
 import pytest
 from unittest import mock
-from enum import Enum
+from enum import Enum, EnumMeta
 from collections import OrderedDict, namedtuple
-from named_enum.meta import NamedEnumMeta, _NamedEnumDict
+from types import MappingProxyType
+from named_enum import NamedEnum, LabeledEnum
+from named_enum.meta import (NamedEnumMeta, _NamedEnumDict, _FieldFunction, _FieldProperty, _get_tuple_cls,
+                              _normalize_field_names, _import_numpy, _to_array,
+                              _OrdinalProperty)
 from ..helper import generator_tester
 
 
@@ -90,40 +97,103 @@ class TestNamedEnumMeta:
     @pytest.mark.parametrize('field_name, as_tuple, expected',
                              [("a", True, (1, 2)),
                               ("a", False, (1, 2))])
-    @mock.patch.object(NamedEnumMeta, 'gen',
-                       side_effect=lambda name_value_pair: (item for item in MockColor))
-    def test__field_values(self, mocked_gen, field_name, as_tuple, expected):
-        result = NamedEnumMeta._field_values(NamedEnumMeta, field_name, as_tuple)
+    def test__field_values(self, field_name, as_tuple, expected):
+        cls = mock.Mock(_cached=mock.Mock(side_effect=lambda key, factory: factory()))
+        cls._fields.return_value = ("b", "a")
+        cls._member_map_.values.return_value = [mock.Mock(value=("x", 1)),
+                                                mock.Mock(value=("y", 2))]
+        result = NamedEnumMeta._field_values(cls, field_name, as_tuple)
         if as_tuple:
             assert result == expected
         else:
             generator_tester(result, expected)
-        mocked_gen.assert_called_once_with(name_value_pair=False)
+        cls._cached.assert_any_call(('values', field_name), mock.ANY)
+        # the function `values` of the metaclass is used, not the one of a field
+        cls.values.assert_not_called()
 
     @pytest.mark.parametrize('params, expected',
                              [(dict(field_name='a', field_value=1, as_tuple=True), (MockColor.red, )),
                               (dict(field_name='a', field_value=1, as_tuple=False), (MockColor.red,)),
                               (dict(field_name='a', field_value=3, as_tuple=True), tuple()),
                               (dict(field_name='a', field_value=3, as_tuple=False), tuple())])
+    @mock.patch.object(NamedEnumMeta, '_field_index',
+                       return_value={1: (MockColor.red, ), 2: (MockColor.blue, )})
+    @mock.patch.object(NamedEnumMeta, 'gen')
+    def test__from_field(self, mocked_gen, mocked__field_index, params, expected):
+        result = NamedEnumMeta._from_field(NamedEnumMeta, **params)
+        if params["as_tuple"]:
+            assert result == expected
+        else:
+            generator_tester(result, expected)
+        mocked__field_index.assert_called_once_with(params["field_name"])
+        mocked_gen.assert_not_called()
+
+    @pytest.mark.parametrize('index, params, expected',
+                             [(None, dict(field_name='a', field_value=1, as_tuple=True), (MockColor.red, )),
+                              (None, dict(field_name='a', field_value=3, as_tuple=False), tuple()),
+                              ({1: (MockColor.red, )}, dict(field_name='a', field_value=[1], as_tuple=True), tuple())])
     @mock.patch.object(NamedEnumMeta, 'gen',
                        side_effect=lambda name_value_pair: (item for item in MockColor))
-    def test__from_field(self, mocked_gen, params, expected):
-        result = NamedEnumMeta._from_field(NamedEnumMeta, **params)
+    def test__from_field_scan(self, mocked_gen, index, params, expected):
+        with mock.patch.object(NamedEnumMeta, '_field_index',
+                               return_value=index):
+            result = NamedEnumMeta._from_field(NamedEnumMeta, **params)
         if params["as_tuple"]:
             assert result == expected
         else:
             generator_tester(result, expected)
-        mocked_gen.assert_called_with(name_value_pair=False)
+        mocked_gen.assert_called_once_with(name_value_pair=False)
+
+    @pytest.mark.parametrize('values, expected',
+                             [([("red", 1), ("blue", 2), ("navy", 2)],
+                               {1: ("red", ), 2: ("blue", "navy")}),
+                              ([("red", 1), ("blue", [2])], None)])
+    def test__field_index(self, values, expected):
+        member_map = {name: mock.Mock(_value_=("x", value))
+                      for name, value in values}
+        cls = mock.Mock(_member_map_=member_map,
+                        _cached=lambda key, factory: factory())
+        cls._fields.return_value = ("b", "a")
+        result = NamedEnumMeta._field_index(cls, 'a')
+        if expected is None:
+            assert result is None
+        else:
+            assert result == {value: tuple(member_map[name] for name in names)
+                              for value, names in expected.items()}
 
     @pytest.mark.parametrize('params, expected',
                              [(('a', 1), True),
                               (('a', 3), False)])
-    @mock.patch.object(NamedEnumMeta, 'gen',
-                       return_value=(item for item in MockColor))
-    def test__has_field(self, mocked_gen, params, expected):
+    @mock.patch.object(NamedEnumMeta, '_field_value_set',
+                       return_value=frozenset({1, 2}))
+    @mock.patch.object(NamedEnumMeta, 'gen')
+    def test__has_field(self, mocked_gen, mocked__field_value_set, params, expected):
         result = NamedEnumMeta._has_field(NamedEnumMeta, *params)
         assert result == expected
-        mocked_gen.assert_called_once_with(name_value_pair=False)
+        mocked__field_value_set.assert_called_once_with(params[0])
+        mocked_gen.assert_not_called()
+
+    @pytest.mark.parametrize('value_set, params, expected',
+                             [(None, ('a', 1), True),
+                              (None, ('a', 3), False),
+                              (frozenset({1, 2}), ('a', [1]), False)])
+    @mock.patch.object(NamedEnumMeta, '_field_values', return_value=(1, 2))
+    def test__has_field_scan(self, mocked__field_values, value_set, params, expected):
+        with mock.patch.object(NamedEnumMeta, '_field_value_set',
+                               return_value=value_set):
+            result = NamedEnumMeta._has_field(NamedEnumMeta, *params)
+        assert result == expected
+        mocked__field_values.assert_called_once_with(NamedEnumMeta, params[0],
+                                                     as_tuple=True)
+
+    @pytest.mark.parametrize('index, expected',
+                             [({1: (), 2: ()}, frozenset({1, 2})),
+                              (None, None)])
+    def test__field_value_set(self, index, expected):
+        cls = mock.Mock(_cached=lambda key, factory: factory())
+        cls._field_index.return_value = index
+        assert NamedEnumMeta._field_value_set(cls, 'a') == expected
+        cls._field_index.assert_called_once_with('a')
 
     @pytest.mark.parametrize("data_type, expected",
                              [(dict, {'red': 1, 'blue': 2}),
@@ -131,12 +201,26 @@ class TestNamedEnumMeta:
                               (set, {('red', 1), ('blue', 2)}),
                               (tuple, (('red', 1), ('blue', 2))),
                               (OrderedDict, OrderedDict([('red', 1), ('blue', 2)]))])
-    @mock.patch.object(NamedEnumMeta, 'gen',
-                       side_effect=lambda name_value_pair: ((item.name, item.value) for item in Color))
-    def test__as_data_type(self, mocked_gen, data_type, expected):
-        result = NamedEnumMeta._as_data_type(NamedEnumMeta, data_type)
+    def test__as_data_type(self, data_type, expected):
+        cls = mock.Mock(_cached=mock.Mock(side_effect=lambda key, factory: factory()))
+        cls.gen.side_effect = lambda name_value_pair: ((item.name, item.value) for item in Color)
+        result = NamedEnumMeta._as_data_type(cls, data_type)
         assert result == expected
-        mocked_gen.assert_called_once_with(name_value_pair=True)
+        assert type(result) is data_type
+        cls._cached.assert_called_once_with('items', mock.ANY)
+        cls.gen.assert_called_once_with(name_value_pair=True)
+
+    @pytest.mark.parametrize("func_name, data_type, expected",
+                             [("as_mapping", dict, MappingProxyType({'red': 1, 'blue': 2})),
+                              ("as_frozenset", frozenset, frozenset({('red', 1), ('blue', 2)}))])
+    def test_as_view(self, func_name, data_type, expected):
+        cls = mock.Mock(_cached=mock.Mock(side_effect=lambda key, factory: factory()))
+        cls._as_data_type.side_effect = lambda data_type: data_type((item.name, item.value) for item in Color)
+        result = getattr(NamedEnumMeta, func_name)(cls)
+        assert result == expected
+        assert type(result) is type(expected)
+        cls._cached.assert_called_once_with(func_name[3:], mock.ANY)
+        cls._as_data_type.assert_called_once_with(data_type)
 
     @pytest.mark.parametrize("func_name, expected",
                              [("as_dict", {'red': 1, 'blue': 2}),
@@ -160,11 +244,714 @@ class TestNamedEnumMeta:
                               ("names", False, ('red', 'blue')),
                               ("values", True, (1, 2)),
                               ("values", False, (1, 2))])
-    @mock.patch.object(NamedEnumMeta, '_member_map_', create=True,
-                       new_callable=mock.PropertyMock(return_value=Color._member_map_))
-    def test_names_values(self, mocked__member_map_, func_name, as_tuple, expected_result):
-        result = getattr(NamedEnumMeta, func_name)(NamedEnumMeta, as_tuple)
+    def test_names_values(self, func_name, as_tuple, expected_result):
+        cls = mock.Mock(_member_map_=Color._member_map_,
+                        _cached=mock.Mock(side_effect=lambda key, factory: factory()))
+        result = getattr(NamedEnumMeta, func_name)(cls, as_tuple)
         if as_tuple:
             assert result == expected_result
         else:
             generator_tester(result, expected_result)
+        cls._cached.assert_called_once_with(func_name, mock.ANY)
+
+    def test___new___field_property(self):
+        class DummyEnum(NamedEnum):
+            _field_names_ = ("name", "first", "second")
+
+        class Dummy(DummyEnum):
+            second = ("Tom", 1, 2)
+
+        assert isinstance(DummyEnum.__dict__["first"], _FieldProperty)
+        assert isinstance(DummyEnum.__dict__["second"], _FieldProperty)
+        # names defined by Enum are not overridden
+        assert "name" not in DummyEnum.__dict__
+        assert Dummy.second.name == "second"
+        assert Dummy.second.first == 1
+        # inherited field properties are not installed again
+        assert "first" not in Dummy.__dict__
+
+    def test_field_func_descriptor(self):
+        class DummyEnum(NamedEnum):
+            _field_names_ = ("key", "label")
+
+        class Dummy(DummyEnum):
+            ONE = ("one", "One")
+
+        assert isinstance(DummyEnum.__dict__["keys"], _FieldFunction)
+        assert Dummy.__dict__["keys"] is DummyEnum.__dict__["keys"]
+        # the class attributes aren't looked up through `__getattr__`
+        assert "__getattr__" not in NamedEnumMeta.__dict__
+        # accessing from the item
+        assert Dummy.ONE.from_key("one") == (Dummy.ONE, )
+        assert isinstance(Dummy.__dict__["from_key"], staticmethod)
+        assert Dummy.from_key.__name__ == "from_key"
+        assert Dummy.from_key is Dummy.from_key
+        # accessing from the class
+        assert Dummy.keys() == ("one", )
+        assert "keys" in Dummy.__dict__
+        # the functions of classes without items are only cached
+        assert DummyEnum.keys() == ()
+        assert DummyEnum.keys is DummyEnum.keys
+        assert isinstance(DummyEnum.__dict__["keys"], _FieldFunction)
+        assert DummyEnum.has_label.__doc__ == \
+            "Returns a boolean value which indicates if there is at least " \
+            "one enumeration item in which the value of the field `label` " \
+            "matches the given field_value."
+
+    def test_field_func_unhashable(self):
+        class Dummy(NamedEnum):
+            _field_names_ = ("key", "tags")
+            ONE = ("one", ["a", "b"])
+            TWO = ("two", ["c"])
+
+        # unhashable field values
+        assert Dummy.tagss() == (["a", "b"], ["c"])
+        assert Dummy.from_tags(["c"]) == (Dummy.TWO, )
+        assert Dummy.has_tags(["a", "b"]) is True
+        assert Dummy.has_tags(["a"]) is False
+        # unhashable field_value
+        assert Dummy.from_key(["one"]) == ()
+        assert list(Dummy.from_key(["one"], as_tuple=False)) == []
+        assert Dummy.has_key(["one"]) is False
+        # batch functions
+        assert Dummy.from_tags_many([["c"], ["a", "b"]]) == ((Dummy.TWO, ), (Dummy.ONE, ))
+        assert Dummy.from_key_many(["one", ["one"]], missing="none") == ((Dummy.ONE, ), None)
+        assert Dummy.has_tags_many([["c"], ["d"]]) == (True, False)
+        assert Dummy.has_key_many(["one", ["one"]]) == (True, False)
+
+    def test_from_fields_composite_index(self):
+        class IndexedEnum(NamedEnum):
+            _field_names_ = ("first", "second", "third")
+            _indexes_ = ["first, second", ("first", "second", "third"), ("third", )]
+
+        class Dummy(IndexedEnum):
+            ONE = (1, 1, 1)
+            TWO = (1, 1, 2)
+            THREE = (1, 2, 2)
+
+        assert Dummy._composite_indexes() == (("first", "second"),
+                                              ("first", "second", "third"),
+                                              ("third", ))
+        with mock.patch.object(Dummy, "_field_index") as mocked__field_index:
+            assert Dummy.from_fields(first=1, second=1) == (Dummy.ONE, Dummy.TWO)
+            assert Dummy.from_fields(first=1, second=1, third=2) == (Dummy.TWO, )
+            assert Dummy.from_fields(second=1, third=2) == (Dummy.TWO, )
+            assert Dummy.from_fields(first=1, second=3) == ()
+            mocked__field_index.assert_not_called()
+        assert Dummy._composite_index(("first", "second")) == {
+            (1, 1): (Dummy.ONE, Dummy.TWO), (1, 2): (Dummy.THREE, )}
+        # single field indexes
+        assert Dummy.from_fields(first=1, second=2) == (Dummy.THREE, )
+        assert Dummy.from_fields(second=1) == (Dummy.ONE, Dummy.TWO)
+
+    def test_from_fields_unhashable(self):
+        class IndexedEnum(NamedEnum):
+            _field_names_ = ("key", "tags")
+            _indexes_ = [("key", "tags")]
+
+        class Dummy(IndexedEnum):
+            ONE = ("one", ["a", "b"])
+            TWO = ("two", ["c"])
+            UNO = ("one", ["c"])
+
+        assert Dummy._composite_index(("key", "tags")) is None
+        assert Dummy.from_fields(key="one", tags=["c"]) == (Dummy.UNO, )
+        assert Dummy.from_fields(tags=["c"]) == (Dummy.TWO, Dummy.UNO)
+        assert Dummy.from_fields(key=["one"]) == ()
+        assert Dummy.from_fields(key="one") == (Dummy.ONE, Dummy.UNO)
+
+    @pytest.mark.parametrize("indexes", [("first", "second"), ["first"], "first, second"])
+    def test__indexes__bare_field_names_fail(self, indexes):
+        with pytest.raises(ValueError, match="The indexes of Dummy must be a sequence of the "
+                                             "field names of each index"):
+            class Dummy(NamedEnum):
+                _field_names_ = ("first", "second")
+                _indexes_ = indexes
+
+    def test__indexes__fail(self):
+        with pytest.raises(ValueError, match="'third' is not a field of Dummy."):
+            class Dummy(NamedEnum):
+                _field_names_ = ("first", "second")
+                _indexes_ = [("first", "third")]
+        with pytest.raises(ValueError, match="'first' is not a field of Dummy."):
+            class Dummy(NamedEnum):
+                _indexes_ = [("first", )]
+
+    def test_fuzzy_field(self):
+        class Dummy(LabeledEnum):
+            US = ("us", "United States")
+            UK = ("uk", "United Kingdom")
+            UK_2 = ("gb", "United Kingdom")
+            DE = ("de", "Germany")
+            GE = ("ge", "Georgia")
+            EMPTY = ("empty", "")
+
+        postings, gram_counts, items = Dummy._trigram_index("label")
+        assert postings["  u"] == (0, 1)
+        assert gram_counts[2] == 8
+        assert items[1] == (Dummy.UK, Dummy.UK_2)
+        assert Dummy.fuzzy_label("untied  states") == (Dummy.US, )
+        assert Dummy.fuzzy_label("germny") == (Dummy.DE, )
+        assert Dummy.fuzzy_label("United") == (Dummy.US, Dummy.UK, Dummy.UK_2)
+        assert Dummy.fuzzy_label("United kingdom") == (Dummy.UK, Dummy.UK_2, Dummy.US)
+        assert Dummy.fuzzy_label("United kingdom", min_score=0.9) == (Dummy.UK, Dummy.UK_2)
+        assert Dummy.fuzzy_label("United kingdom", limit=1) == (Dummy.UK, )
+        assert Dummy.fuzzy_label("United kingdom", limit=0) == ()
+        assert Dummy.fuzzy_label("United kingdom", limit=-1) == ()
+        # the same score, the earlier defined value wins
+        assert Dummy.fuzzy_label("ge", limit=None, min_score=0) == (Dummy.DE, Dummy.GE)
+        assert Dummy.fuzzy_label("xyz") == ()
+        assert Dummy.fuzzy_label(" ") == (Dummy.EMPTY, )
+        assert Dummy.fuzzy_key("UK") == (Dummy.UK, )
+
+    def test_fuzzy_field_fail(self):
+        class Dummy(NamedEnum):
+            _field_names_ = ("key", "tags")
+            ONE = (1, ["one"])
+
+        assert Dummy._trigram_index("key") is None
+        assert Dummy._trigram_index("tags") is None
+        with pytest.raises(TypeError, match="The values of the field 'key' in Dummy are not strings."):
+            Dummy.fuzzy_key("1")
+
+    def test_from_any(self):
+        class Dummy(NamedEnum):
+            _field_names_ = ("key", "label", "tags")
+            APPLE = ("apple", "APPLE", ["fruit"])
+            BANANA = ("banana", "apple", ["fruit"])
+            APFEL = ("apple", "APPLE", ["fruit"])
+
+        assert Dummy.from_any("APPLE") == (("name", Dummy.APPLE), ("label", Dummy.APPLE))
+        assert Dummy.from_any("APFEL") == (("name", Dummy.APPLE), )
+        assert Dummy.from_any("apple") == (("key", Dummy.APPLE), ("label", Dummy.BANANA))
+        assert Dummy.from_any("banana") == (("key", Dummy.BANANA), )
+        assert Dummy.from_any("cherry") == ()
+        assert Dummy.from_any(["fruit"]) == ()
+        with mock.patch.object(Dummy, "_member_map_") as mocked__member_map_:
+            assert Dummy.from_any("BANANA") == (("name", Dummy.BANANA), )
+            mocked__member_map_.items.assert_not_called()
+
+    def test_get_by_field(self):
+        class UniqueEnum(NamedEnum):
+            _field_names_ = ("key", "label", "tags")
+            _unique_fields_ = "key, tags"
+
+        class Dummy(UniqueEnum):
+            APPLE = ("apple", "fruit", ("red", ))
+            BANANA = ("banana", "fruit", ("yellow", ))
+            APFEL = ("apple", "fruit", ("red", ))
+
+        assert UniqueEnum._unique_fields() == ("key", "tags")
+        assert Dummy._unique_index("key") == {"apple": Dummy.APPLE, "banana": Dummy.BANANA}
+        with mock.patch.object(Dummy, "_member_map_") as mocked__member_map_:
+            assert Dummy.get_by_key("apple") is Dummy.APPLE
+            assert Dummy.get_by_key("cherry") is None
+            assert Dummy.get_by_key("cherry", Dummy.BANANA) is Dummy.BANANA
+            assert Dummy.get_by_key(["apple"], default=0) == 0
+            assert Dummy.get_by_tags(("yellow", )) is Dummy.BANANA
+            mocked__member_map_.values.assert_not_called()
+        assert Dummy.get_by_key.__name__ == "get_by_key"
+        assert list(inspect.signature(Dummy.get_by_key).parameters) == ["field_value", "default"]
+        with pytest.raises(AttributeError, match="get_by_label"):
+            Dummy.get_by_label
+
+    def test__unique_fields__fail(self):
+        with pytest.raises(ValueError, match="'label' is not a field of Dummy."):
+            class Dummy(NamedEnum):
+                _field_names_ = ("key", )
+                _unique_fields_ = ("label", )
+
+        class UniqueEnum(NamedEnum):
+            _field_names_ = ("key", "label")
+            _unique_fields_ = ("key", )
+
+        with pytest.raises(ValueError, match="'apple' is a duplicate value of the unique "
+                                             "field 'key' in Dummy, held by APPLE and APFEL."):
+            class Dummy(UniqueEnum):
+                APPLE = ("apple", "Apple")
+                APFEL = ("apple", "Apfel")
+        with pytest.raises(TypeError, match="unhashable"):
+            class Dummy(UniqueEnum):
+                APPLE = (["apple"], "Apple")
+
+    def test_from_field_normalized(self):
+        class NormalizedEnum(NamedEnum):
+            _field_names_ = ("key", "label")
+            _normalizers_ = {"key": lambda value: value.strip().casefold()}
+
+        class Dummy(NormalizedEnum):
+            APPLE = ("Apple", "apple")
+            BANANA = ("BANANA", "banana")
+            BANANA_2 = (" banana", "banana 2")
+
+        assert NormalizedEnum._normalizers() == NormalizedEnum._normalizers_
+        assert Dummy._normalized_index("key") == {
+            "apple": (Dummy.APPLE, ), "banana": (Dummy.BANANA, Dummy.BANANA_2)}
+        with mock.patch.object(Dummy, "_member_map_") as mocked__member_map_:
+            assert Dummy.from_key_normalized("  APPLE ") == (Dummy.APPLE, )
+            assert Dummy.from_key_normalized("Banana") == (Dummy.BANANA, Dummy.BANANA_2)
+            assert Dummy.from_key_normalized("cherry") == ()
+            mocked__member_map_.values.assert_not_called()
+        assert Dummy.from_key_normalized.__name__ == "from_key_normalized"
+        assert list(inspect.signature(Dummy.from_key_normalized).parameters) == ["field_value"]
+        with pytest.raises(AttributeError):
+            Dummy.from_key_normalized(1)
+        with pytest.raises(AttributeError, match="from_label_normalized"):
+            Dummy.from_label_normalized
+
+        class Unhashable(NamedEnum):
+            _field_names_ = ("key", )
+            _normalizers_ = {"key": lambda value: value}
+            ONE = "one"
+
+        assert Unhashable.from_key_normalized(["one"]) == ()
+
+        class Casefolded(NamedEnum):
+            _field_names_ = ("key", "number")
+            _normalizers_ = {"key": str.casefold, "number": int}
+            ONE = ("One", "1")
+
+        assert Casefolded.from_key_normalized("ONE") == (Casefolded.ONE, )
+        assert Casefolded.from_key(5) == ()
+        assert Casefolded.from_key_normalized(5) == ()
+        assert Casefolded.from_number_normalized(1.0) == (Casefolded.ONE, )
+        assert Casefolded.from_number_normalized("one") == ()
+        assert Casefolded.from_number_normalized(None) == ()
+
+    def test__normalizers__fail(self):
+        with pytest.raises(ValueError, match="'label' is not a field of Dummy."):
+            class Dummy(NamedEnum):
+                _field_names_ = ("key", )
+                _normalizers_ = {"label": str.casefold}
+        with pytest.raises(TypeError, match="The normalizer 'casefold' of the field 'key' in Dummy is not callable."):
+            class Dummy(NamedEnum):
+                _field_names_ = ("key", )
+                _normalizers_ = {"key": "casefold"}
+        with pytest.raises(TypeError, match="unhashable"):
+            class Dummy(NamedEnum):
+                _field_names_ = ("key", )
+                _normalizers_ = {"key": lambda value: [value]}
+                ONE = "one"
+
+    def test_field_range(self):
+        class Dummy(NamedEnum):
+            _field_names_ = ("threshold", "label")
+            LOW = (1, "low")
+            MEDIUM = (5, "medium")
+            HIGH = (9, "high")
+            MIDDLE = (5, "middle")
+
+        assert Dummy._sorted_index("threshold") == (
+            [1, 5, 5, 9], (Dummy.LOW, Dummy.MEDIUM, Dummy.MIDDLE, Dummy.HIGH))
+        assert Dummy.threshold_between(2, 9) == (Dummy.MEDIUM, Dummy.MIDDLE, Dummy.HIGH)
+        assert Dummy.threshold_between(2, 4) == ()
+        assert Dummy.threshold_lt(5) == (Dummy.LOW, )
+        assert Dummy.threshold_le(5) == (Dummy.LOW, Dummy.MEDIUM, Dummy.MIDDLE)
+        assert Dummy.threshold_gt(5.5) == (Dummy.HIGH, )
+        assert Dummy.threshold_ge(0) == (Dummy.LOW, Dummy.MEDIUM, Dummy.MIDDLE, Dummy.HIGH)
+        assert Dummy.threshold_nearest(4) == (Dummy.MEDIUM, Dummy.MIDDLE)
+        assert Dummy.threshold_nearest(3) == (Dummy.LOW, )
+        assert Dummy.threshold_nearest(7) == (Dummy.MEDIUM, Dummy.MIDDLE)
+        assert Dummy.threshold_nearest(8) == (Dummy.HIGH, )
+        assert Dummy.threshold_nearest(-10) == (Dummy.LOW, )
+        assert Dummy.threshold_nearest(100) == (Dummy.HIGH, )
+        assert Dummy.label_between("l", "n") == (Dummy.LOW, Dummy.MEDIUM, Dummy.MIDDLE)
+        assert Dummy.label_nearest("middle") == (Dummy.MIDDLE, )
+        with pytest.raises(TypeError, match="The values of the field 'label' in Dummy "
+                                            "are not numeric."):
+            Dummy.label_nearest("j")
+
+        class Fruit(LabeledEnum):
+            APPLE = ("apple", "Apple")
+            CHERRY = ("cherry", "Cherry")
+
+        assert Fruit.key_nearest("apple") == (Fruit.APPLE, )
+        with pytest.raises(TypeError, match="The values of the field 'key' in Fruit "
+                                            "are not numeric."):
+            Fruit.key_nearest("banana")
+        with pytest.raises(TypeError):
+            Dummy.threshold_lt("5")
+
+    def test_field_range_empty(self):
+        assert LabeledEnum.key_between("a", "z") == ()
+        assert LabeledEnum.key_nearest("a") == ()
+
+    def test_field_range_unorderable(self):
+        class Dummy(NamedEnum):
+            _field_names_ = ("threshold", "label")
+            LOW = (1, "low")
+            NONE = (None, "none")
+
+        assert Dummy._sorted_index("threshold") is None
+        for func_name, params in [("threshold_lt", (1, )), ("threshold_le", (1, )),
+                                  ("threshold_gt", (1, )), ("threshold_ge", (1, )),
+                                  ("threshold_between", (1, 2)), ("threshold_nearest", (1, ))]:
+            with pytest.raises(TypeError, match="The values of the field 'threshold' in "
+                                                "Dummy are not orderable."):
+                getattr(Dummy, func_name)(*params)
+
+    def test_field_startswith(self):
+        max_char = chr(_sys.maxunicode)
+
+        class Dummy(LabeledEnum):
+            APPLE = ("apple", "Apple")
+            APRICOT = ("apricot", "Apricot")
+            AP = ("ap", "Ap")
+            BANANA = ("banana", "Banana")
+            LOWER_APPLE = ("lower_apple", "apple")
+            MAX = ("max", "Ap" + max_char)
+            MAX_2 = ("max_2", "Ap" + max_char + "a")
+
+        assert Dummy.label_startswith("Ap") == (
+            Dummy.AP, Dummy.APPLE, Dummy.APRICOT, Dummy.MAX, Dummy.MAX_2)
+        assert Dummy.label_startswith("Apr") == (Dummy.APRICOT, )
+        assert Dummy.label_startswith("Ap", limit=2) == (Dummy.AP, Dummy.APPLE)
+        assert Dummy.label_startswith("Ap", limit=0) == ()
+        assert Dummy.label_startswith("Ap", limit=-1) == ()
+        assert Dummy.label_startswith("", limit=3) == (Dummy.AP, Dummy.APPLE, Dummy.APRICOT)
+        assert len(Dummy.label_startswith("")) == 7
+        assert Dummy.label_startswith("Ap" + max_char) == (Dummy.MAX, Dummy.MAX_2)
+        assert Dummy.label_startswith("C") == ()
+        assert Dummy.label_startswith("apple") == (Dummy.LOWER_APPLE, )
+        with pytest.raises(TypeError, match="The prefix of the field 'label' in "
+                                            "Dummy must be a string, not 1."):
+            Dummy.label_startswith(1)
+
+    def test_field_startswith_fail(self):
+        class Dummy(NamedEnum):
+            _field_names_ = ("key", "number")
+            ONE = ("one", 1)
+            TWO = ("two", 2)
+
+        with pytest.raises(TypeError, match="The values of the field 'number' "
+                                            "in Dummy are not strings."):
+            Dummy.number_startswith("1")
+        with pytest.raises(TypeError, match="The values of the field 'number' "
+                                            "in Dummy are not strings."):
+            Dummy.number_startswith(1)
+        assert Dummy.key_startswith("t") == (Dummy.TWO, )
+
+    def test_field_func_fail(self):
+        class Dummy(LabeledEnum):
+            ONE = ("one", "One")
+
+        with pytest.raises(AttributeError, match="from_name"):
+            Dummy.from_name
+        with pytest.raises(AttributeError, match="_keys"):
+            Dummy._keys
+        with pytest.raises(AttributeError, match="labelss"):
+            Dummy.labelss
+
+        # the descriptors inherited from a parent class with other fields
+        class Sub(LabeledEnum):
+            _field_names_ = ("first", "second")
+            ONE = (1, 2)
+
+        with pytest.raises(AttributeError, match="from_key"):
+            Sub.from_key
+        assert not hasattr(Sub.ONE, "keys")
+
+    def test_field_func_during_item_creation(self):
+        class Base(NamedEnum):
+            _field_names_ = ("a", )
+
+        class Sub(Base):
+            _field_names_ = ("x", "y")
+            ONE = (1, 2)
+
+            def __init__(self, *args):
+                # looks up the functions before the class is created
+                self.has_from_x = hasattr(self, "from_x")
+                self.has_from_a = hasattr(self, "from_a")
+
+        assert Sub.ONE.has_from_x is False
+        assert Sub.ONE.has_from_a is False
+        assert Sub.from_x(1) == (Sub.ONE, )
+        assert Sub.xs() == (1, )
+        assert Sub.ys() == (2, )
+        assert not hasattr(Sub, "from_a")
+
+        class Cached(Base):
+            _field_names_ = ("x", "y")
+            ONE = (1, 2)
+            TWO = (3, 4)
+
+            def __init__(self, *args):
+                # caches the values of the items created so far
+                type(self).names()
+                type(self).values()
+
+        assert Cached.names() == ("ONE", "TWO")
+        assert Cached.values() == ((1, 2), (3, 4))
+        assert Cached.xs() == (1, 3)
+        assert Cached.from_x(3) == (Cached.TWO, )
+
+    def test_from_records(self):
+        records = (("ITEM_%d" % i, ("key_%d" % i, "Label %d" % i)) for i in range(3))
+        Dummy = LabeledEnum.from_records("Dummy", records)
+        assert repr(Dummy) == "<named enum 'Dummy'>"
+        assert issubclass(Dummy, LabeledEnum)
+        assert Dummy.__module__ == __name__
+        assert Dummy.__qualname__ == "Dummy"
+        assert Dummy.names() == ("ITEM_0", "ITEM_1", "ITEM_2")
+        assert Dummy.keys() == ("key_0", "key_1", "key_2")
+        assert Dummy.ITEM_1.value == Dummy._tuple_cls("key_1", "Label 1")
+        assert Dummy.from_label("Label 2") == (Dummy.ITEM_2, )
+
+    def test_from_records_module(self):
+        Dummy = LabeledEnum.from_records("Dummy", [("ONE", ("one", "One"))],
+                                         module="dummy_module")
+        assert Dummy.__module__ == "dummy_module"
+        with mock.patch("named_enum.meta._sys._getframe",
+                        side_effect=AttributeError) as mocked__getframe:
+            Dummy = LabeledEnum.from_records("Dummy", [("ONE", ("one", "One"))])
+        assert Dummy.__module__ == "Dummy"
+        mocked__getframe.assert_called_once_with(1)
+
+    def test_from_records_fail(self):
+        with pytest.raises(ValueError, match="Unable to unpack the value"):
+            LabeledEnum.from_records("Dummy", [("ONE", "one")])
+        with pytest.raises(TypeError, match="Attempted to reuse key: 'ONE'"):
+            LabeledEnum.from_records("Dummy", [("ONE", ("one", "One")),
+                                               ("ONE", ("two", "Two"))])
+
+
+@pytest.mark.parametrize("field_names",
+                         ["key, label", "key label", ("key", "label"), ["key", "label"]])
+def test__get_tuple_cls(field_names):
+    class Dummy(LabeledEnum):
+        KEY = ("key", "label")
+
+    result = _get_tuple_cls(field_names)
+    assert result._fields == ("key", "label")
+    assert result is Dummy._tuple_cls
+    assert result is LabeledEnum._tuple_cls
+    assert result is not _get_tuple_cls(("key", ))
+
+
+@pytest.mark.parametrize("field_names, expected",
+                         [("key, label", ("key", "label")),
+                          (" key  label ", ("key", "label")),
+                          (["key", "label"], ("key", "label")),
+                          ((1, 2), ("1", "2")),
+                          ((), ())])
+def test__normalize_field_names(field_names, expected):
+    assert _normalize_field_names(field_names) == expected
+
+
+def test__get_tuple_cls_fail():
+    with pytest.raises(ValueError):
+        _get_tuple_cls(("key", "1label"))
+
+
+def test__import_numpy():
+    np = pytest.importorskip("numpy")
+    assert _import_numpy() is np
+    with mock.patch.dict("sys.modules", {"numpy": None}):
+        with pytest.raises(ImportError, match="NumPy is required"):
+            _import_numpy()
+
+
+@pytest.mark.parametrize("values, expected_dtype",
+                         [((1, 2), "int64"),
+                          ((1, 2.5), "float64"),
+                          (("a", "bc"), "<U2"),
+                          (("a", 1), "object"),
+                          ((None, 1), "object"),
+                          (((1, 2), (3, 4)), "object"),
+                          (((1, 2), (3, )), "object"),
+                          ((), "float64")])
+def test__to_array(values, expected_dtype):
+    np = pytest.importorskip("numpy")
+    result = _to_array(np, values)
+    assert result.dtype == np.dtype(expected_dtype)
+    assert result.shape == (len(values), )
+    assert tuple(result.tolist()) == values
+    assert not result.flags.writeable
+
+
+def test_to_numpy_without_numpy():
+    class Dummy(LabeledEnum):
+        ONE = ("one", "One")
+
+    with mock.patch.dict("sys.modules", {"numpy": None}):
+        with pytest.raises(ImportError, match="NumPy is required"):
+            Dummy.to_numpy("key")
+        with pytest.raises(ImportError, match="NumPy is required"):
+            Dummy.to_structured_array()
+
+
+def test_field_named_as_metaclass_function():
+    class Dummy(NamedEnum):
+        _field_names_ = ("values", "describe")
+        ONE = (1, "one")
+        TWO = (2, "two")
+
+    assert "values" not in Dummy.__dict__
+    assert "describe" not in Dummy.__dict__
+    assert Dummy.values() == (Dummy.ONE.value, Dummy.TWO.value)
+    assert Dummy.valuess() == (1, 2)
+    assert Dummy.describes() == ("one", "two")
+    assert Dummy.from_values(2) == (Dummy.TWO, )
+    assert Dummy.ONE.values == 1
+    assert Dummy.TWO.describe == "two"
+    Dummy.describe()
+
+
+def test_field_func_precedence():
+    class PrecedenceEnum(NamedEnum):
+        _field_names_ = ("fields", "value")
+
+    class Dummy(PrecedenceEnum):
+        ONE = (1, "one")
+        TWO = (2, "two")
+
+    for enum_cls in (PrecedenceEnum, Dummy):
+        assert inspect.isfunction(enum_cls.from_fields)
+        assert inspect.isfunction(enum_cls.values)
+    # the functions of the fields win over the ones of the metaclass
+    assert Dummy.from_fields(2) == (Dummy.TWO, )
+    assert Dummy.from_fields(3) == ()
+    assert Dummy.values() == ("one", "two")
+    assert Dummy.fieldss() == (1, 2)
+    assert Dummy.ONE.fields == 1
+    Dummy.describe()
+
+
+def test_field_named_any():
+    class Dummy(NamedEnum):
+        _field_names_ = ("any", "label")
+        ONE = (1, "one")
+        TWO = (2, "two")
+
+    assert Dummy.from_any(2) == (Dummy.TWO, )
+    assert Dummy.from_any("TWO") == ()
+    assert NamedEnumMeta.from_any(Dummy, "TWO") == (("name", Dummy.TWO), )
+
+
+def test_field_named_records():
+    class RecordEnum(NamedEnum):
+        _field_names_ = ("records", "label")
+
+    class Dummy(RecordEnum):
+        ONE = (1, "one")
+
+    assert Dummy.from_records(1) == (Dummy.ONE, )
+    assert RecordEnum.from_records(1) == ()
+    Created = NamedEnumMeta.from_records(RecordEnum, "Created", [("TWO", (2, "two"))])
+    assert Created.from_records(2) == (Created.TWO, )
+
+
+def test_ordinal_alias():
+    class Dummy(LabeledEnum):
+        ONE = ("one", "One")
+        TWO = ("two", "Two")
+        UNO = ("one", "One")
+
+    assert Dummy.UNO is Dummy.ONE
+    assert Dummy.names() == ("ONE", "TWO", "UNO")
+    assert Dummy._ordinal_members() == (Dummy.ONE, Dummy.TWO)
+    assert Dummy.TWO.ordinal == 1
+    assert Dummy.from_ordinal(1) is Dummy.TWO
+    with pytest.raises(ValueError, match="2 is not a valid ordinal of Dummy."):
+        Dummy.from_ordinal(2)
+
+
+def test_ordinal_field():
+    class OrdinalEnum(NamedEnum):
+        _field_names_ = ("ordinal", "label")
+
+    class Dummy(OrdinalEnum):
+        FIRST = (10, "First")
+        SECOND = (20, "Second")
+
+    assert isinstance(NamedEnum.__dict__["ordinal"], _OrdinalProperty)
+    assert isinstance(OrdinalEnum.__dict__["ordinal"], _FieldProperty)
+    assert Dummy.SECOND.ordinal == 20
+    assert Dummy.SECOND._ordinal_ == 1
+    assert Dummy.from_ordinal(20) == (Dummy.SECOND, )
+    assert Dummy.from_ordinal(1) == ()
+    assert Dummy.ordinals() == (10, 20)
+
+
+class TestEncodeDecode:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.np = pytest.importorskip("numpy")
+
+        class Dummy(LabeledEnum):
+            ONE = (1, "one")
+            TWO = (2, "two")
+            UNO = (1, ["uno"])
+            ALIAS = (2, "two")
+
+        self.enum_cls = Dummy
+
+    @pytest.mark.parametrize("values",
+                             [[2, 1, 2], (2, 1, 2), (2.0, 1.0, 2.0),
+                              array.array("l", [2, 1, 2])])
+    def test_encode_numeric(self, values):
+        assert self.enum_cls.encode("key", values).tolist() == [1, 0, 1]
+        assert self.enum_cls.encode("key", self.np.array(values)).tolist() == [1, 0, 1]
+        assert self.enum_cls.encode("key", iter(values)).tolist() == [1, 0, 1]
+
+    def test_encode_lookup(self):
+        # the column of the field 'label' has the object dtype
+        assert self.enum_cls.encode("label", ["two", ["uno"], "one"]).tolist() == [1, 2, 0]
+        # the values of the field 'key' are numeric, but the given ones aren't
+        assert self.enum_cls.encode("key", ["1", 2], fill_value=-1).tolist() == [-1, 1]
+
+    def test_encode_fill_value(self):
+        result = self.enum_cls.encode("key", [3, 1, 0], fill_value=-1)
+        assert result.tolist() == [-1, 0, -1]
+        assert result.dtype == self.np.intp
+        assert self.enum_cls.encode("key", []).tolist() == []
+
+    @pytest.mark.parametrize("field_name, values, err_msg",
+                             [("key", [1, 3], "3 is not a valid value of the field 'key' in Dummy."),
+                              ("label", ["one", "three"],
+                               "'three' is not a valid value of the field 'label' in Dummy."),
+                              ("value", [1], "'value' is not a field of Dummy.")])
+    def test_encode_fail(self, field_name, values, err_msg):
+        with pytest.raises(ValueError) as excinfo:
+            self.enum_cls.encode(field_name, values)
+        assert str(excinfo.value) == err_msg
+
+    def test_encode_unhashable(self):
+        class Dummy(LabeledEnum):
+            ONE = ([1], "one")
+            TWO = ([2], "two")
+
+        assert Dummy.encode("key", [[2], [1], [3]], fill_value=-1).tolist() == [1, 0, -1]
+
+    def test_decode(self):
+        ordinals = self.np.array([2, 0, 1])
+        assert self.enum_cls.decode(ordinals).tolist() == \
+            [self.enum_cls.UNO, self.enum_cls.ONE, self.enum_cls.TWO]
+        assert self.enum_cls.decode(ordinals, "key").tolist() == [1, 1, 2]
+        assert self.enum_cls.decode(iter([2]), "label").tolist() == [["uno"]]
+        assert self.enum_cls.decode([]).tolist() == []
+
+    @pytest.mark.parametrize("ordinals, field_name, err_msg",
+                             [([0, 3], None, "3 is not a valid ordinal of Dummy."),
+                              ([-1], "key", "-1 is not a valid ordinal of Dummy."),
+                              ([0], "value", "'value' is not a field of Dummy."),
+                              ([1.7], None, "1.7 is not a valid ordinal of Dummy."),
+                              (["1"], "key", "'1' is not a valid ordinal of Dummy."),
+                              ([True], None, "True is not a valid ordinal of Dummy.")])
+    def test_decode_fail(self, ordinals, field_name, err_msg):
+        with pytest.raises(ValueError) as excinfo:
+            self.enum_cls.decode(ordinals, field_name)
+        assert str(excinfo.value) == err_msg
+
+    def test_decode_float_array_fail(self):
+        with pytest.raises(ValueError, match="1.0 is not a valid ordinal of Dummy."):
+            self.enum_cls.decode(self.np.array([1.0, 2.5]))
+
+
+class TestFieldProperty:
+
+    def test___get__(self):
+        prop = _FieldProperty("a")
+        obj = mock.Mock(_value_=mock.Mock(a=1))
+        assert prop.__get__(obj, type(obj)) == 1
@@ -1,5 +1,6 @@
 import pytest
 import sys as _sys
+from unittest import mock
 from enum import _EnumDict
 from named_enum.meta import _NamedEnumDict
 from collections import namedtuple
@@ -9,8 +10,14 @@ class TestNamedEnumDict:
 
     @pytest.fixture(autouse=True)
     def setup(self):
-        self.dict = _NamedEnumDict()
-        self.dict._cls_name = "Dummy"
+        self.dict = self.new_dict()
+
+    @staticmethod
+    def new_dict():
+        """Returns an empty _NamedEnumDict dictionary of the class 'Dummy'."""
+        enum_dict = _NamedEnumDict()
+        enum_dict._cls_name = "Dummy"
+        return enum_dict
 
     @pytest.fixture
     def fill(self):
@@ -46,6 +53,18 @@ class TestNamedEnumDict:
         self.dict["_field_names_"] = "b"
         assert self.dict["_field_names_"] == "b"
 
+        self.dict["_indexes_"] = [("b", )]
+        assert self.dict["_indexes_"] == [("b", )]
+        assert "_indexes_" not in self.dict._member_names
+
+        self.dict["_normalizers_"] = {"b": str.casefold}
+        assert self.dict["_normalizers_"] == {"b": str.casefold}
+        assert "_normalizers_" not in self.dict._member_names
+
+        self.dict["_unique_fields_"] = ("b", )
+        assert self.dict["_unique_fields_"] == ("b", )
+        assert "_unique_fields_" not in self.dict._member_names
+
         self.dict["a"] = "a"
         assert self.dict["a"] == "a"
 
@@ -63,18 +82,6 @@ class TestNamedEnumDict:
         else:
             assert "_sunder_ names, such as '_a_', are reserved for future Enum use" in str(excinfo.value)
 
-    def test__clean(self, fill):
-        """
-        Test the clean method, which cleans the _last_values, _member_names,
-        and the keys without underline or double underline surround.
-        """
-        self.dict._clean()
-
-        assert self.dict == {"_field_names_": "b", "__a__": 'a'}
-        tmp = _EnumDict()
-        assert self.dict._last_values == tmp._last_values
-        assert self.dict._member_names == tmp._member_names
-
     def test__convert_fail(self, fill):
         """Test the _convert function in failure case."""
         # if the tuple_cls is tuple, it should raise an error
@@ -84,13 +91,13 @@ class TestNamedEnumDict:
                " generated class instead." in str(excinfo.value)
 
         tuple_cls = namedtuple("NamedTuple", ["key", "value"])
-        self.dict._clean()
+        self.dict = self.new_dict()
         self.dict['b'] = 1
         with pytest.raises(ValueError) as exe_info:
             self.dict._convert(tuple_cls)
         assert "Unable to unpack the value '1' as NamedTuple for the fields." in str(exe_info.value)
 
-        self.dict._clean()
+        self.dict = self.new_dict()
         self.dict['b'] = "1,2"
         with pytest.raises(ValueError) as exe_info:
             self.dict._convert(tuple_cls)
@@ -115,11 +122,12 @@ class TestNamedEnumDict:
         else:
             assert self.dict._member_names == {'_a': None, 'a': None, 'b': None}
 
-    def test__convert_success_more_feature(self, fill):
+    def test__convert_success_more_feature(self):
         """Test the _convert function in success case."""
         # create a named tuple and call the _convert, everything should be fine.
         tuple_cls = namedtuple("NamedTuple", ["key", "value"])
-        self.dict._clean()
+        self.dict["_field_names_"] = "b"
+        self.dict["__a__"] = "a"
         self.dict['b'] = [111, 222]
         self.dict._convert(tuple_cls)
 
@@ -131,3 +139,46 @@ class TestNamedEnumDict:
             assert self.dict._member_names == ["b"]
         else:
             assert self.dict._member_names == {'b': None}
+
+    def test__convert_single_pass(self, fill):
+        """Test the _convert function doesn't set the items through
+        __setitem__ again."""
+        tuple_cls = namedtuple("NamedTuple", ["key"])
+        last_values = self.dict._last_values
+        with mock.patch.object(_EnumDict, '__setitem__') as mocked___setitem__:
+            self.dict._convert(tuple_cls)
+        mocked___setitem__.assert_not_called()
+        assert self.dict._last_values is last_values
+        assert list(self.dict) == ["_field_names_", "a", "_a", "__a__", "b"]
+
+    def test__add_members(self, fill):
+        """Test the _add_members function adds the items like __setitem__."""
+        expected = _NamedEnumDict()
+        expected._cls_name = "Dummy"
+        expected["_field_names_"] = "b"
+        for key, value in [("a", ["a", "b"]), ("_a", "a"), ("__a__", "a"),
+                           ("b", 1), ("c", (1, 2)), ("d", "d")]:
+            expected[key] = value
+
+        self.dict._add_members(item for item in [("c", (1, 2)), ("d", "d")])
+        assert self.dict == expected
+        assert self.dict._last_values == expected._last_values
+        assert self.dict._member_names == expected._member_names
+
+    def test__add_members_list(self, fill):
+        """Before python 3.11 the variable '_member_names' is a list."""
+        self.dict._member_names = list(self.dict._member_names)
+        self.dict._add_members([("c", (1, 2))])
+        assert self.dict._member_names == ["a", "_a", "b", "c"]
+        assert self.dict["c"] == (1, 2)
+
+    @pytest.mark.parametrize("records, error_type, err_msg",
+                             [([("_c_", 1)], ValueError, "Invalid name of enumeration item: '_c_'."),
+                              ([("__c__", 1)], ValueError, "Invalid name of enumeration item: '__c__'."),
+                              ([(1, 1)], ValueError, "Invalid name of enumeration item: 1."),
+                              ([("b", 2)], TypeError, "Attempted to reuse key: 'b'"),
+                              ([("c", 2), ("c", 3)], TypeError, "Attempted to reuse key: 'c'")])
+    def test__add_members_fail(self, fill, records, error_type, err_msg):
+        with pytest.raises(error_type) as excinfo:
+            self.dict._add_members(records)
+        assert str(excinfo.value) == err_msg